@@ -1,55 +1,158 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from utils.config_reader import ConfigReader
+from selenium.common.exceptions import ElementClickInterceptedException, NoSuchElementException, TimeoutException
+from base.smart_wait import LOCATE_JS, SmartWait
+from utils.config_reader import get_config
+from utils import driver_profiler
+
+# 🔧 UPDATED: fast-path helpers.
+# Research note: every Selenium call is one HTTP round-trip to chromedriver.
+# EC.visibility_of_element_located alone is 2 calls (find_element + is_displayed), and the old
+# methods then did another find_element before acting. The scripts below locate + check + read
+# in ONE execute_script. SmartWait (base/smart_wait.py) does the same for waits: one async
+# script that returns as soon as the element is ready.
+
+# Returns {ready: bool, value: ...} for a single visible element
+_READ_JS = LOCATE_JS + """
+var el = locate(arguments[0], arguments[1]);
+if (!isVisible(el)) { return {ready: false, value: null}; }
+return {ready: true, value: read(el, arguments[2], arguments[3])};
+"""
+
+# Batched variant: reads several locators at once, null for missing/hidden elements
+_READ_MANY_JS = LOCATE_JS + """
+var locators = arguments[0], out = [];
+for (var i = 0; i < locators.length; i++) {
+    var el = locate(locators[i][0], locators[i][1]);
+    out.push(isVisible(el) ? read(el, arguments[1], arguments[2]) : null);
+}
+return out;
+"""
+
+# List selection in one call: match the text, click the item, or report every candidate seen.
+# arguments[0] is either a [by, value] locator or an array of already found WebElements.
+# Only visible items count (a hidden, leftover menu is never matched), and the matching item must
+# be the element actually hit at its centre - the same interactability rules as element.click().
+_SELECT_FROM_LIST_JS = LOCATE_JS + """
+var source = arguments[0], wanted = arguments[1], mode = arguments[2], items = [];
+if (source.length === 2 && typeof source[0] === 'string') {
+    items = locateAll(source[0], source[1]);
+} else {
+    items = source;
+}
+
+function matches(text) {
+    text = text.trim();
+    if (mode === 'exact') { return text === wanted; }
+    if (mode === 'prefix') { return text.indexOf(wanted) === 0; }
+    if (mode === 'ignore_case') { return text.toLowerCase() === wanted.toLowerCase(); }
+    throw new Error('Unsupported match mode: ' + mode);
+}
+
+function isCovered(el) {
+    var rect = el.getBoundingClientRect();
+    var hit = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+    return !hit || !el.contains(hit);
+}
+
+var candidates = [];
+for (var i = 0; i < items.length; i++) {
+    if (!isVisible(items[i])) { continue; }
+    var text = items[i].innerText;
+    if (matches(text)) {
+        var el = items[i];
+        el.scrollIntoView({block: 'nearest'});
+        if (isCovered(el)) {
+            return {clicked: false, covered: true, text: text.trim(), candidates: []};
+        }
+        // same event sequence as a real mouse click, so jQuery UI menus register the selection
+        ['mouseover', 'mousedown', 'mouseup'].forEach(function (type) {
+            el.dispatchEvent(new MouseEvent(type, {bubbles: true, cancelable: true, view: window}));
+        });
+        el.click();
+        return {clicked: true, covered: false, text: text.trim(), candidates: []};
+    }
+    candidates.push(text.trim());
+}
+return {clicked: false, covered: false, text: null, candidates: candidates};
+"""
+
+MATCH_MODES = ("exact", "prefix", "ignore_case")
+
 
 class BasePage:
-    
+
 # Research note: The timeout parameter in the __init__ method allows customization of the wait time for different pages or elements if needed.
 # *locator is used to unpack the tuple when passing it to find_element method. I mean, if locator is (By.ID, "element_id"), then *locator unpacks it to By.ID, "element_id" when calling find_element.
 
     def __init__(self, driver):
         self.driver = driver
-        config = ConfigReader()
-        timeout = int(config.get('explicit_wait'))
-        self.wait =  WebDriverWait(driver, timeout)
-        
+        # 🔧 UPDATED: cached snapshot of the active --env, no file I/O per page object
+        timeout = get_config().explicit_wait
+        # 🔧 UPDATED: event-driven wait instead of WebDriverWait's fixed 0.5 s polling
+        self.wait =  SmartWait(driver, timeout)
+
+    def _wait_for(self, locator, state, timeout=None):
+        # All explicit waits go through here, so --profile-driver can time them
+        with driver_profiler.wait_span():
+            return self.wait.until_state(locator, state, timeout)
+
+    def _wait_until(self, condition, timeout=None, message=""):
+        # Same for waits on a custom condition (callable taking the driver)
+        with driver_profiler.wait_span():
+            return self.wait.until(condition, timeout=timeout, message=message)
+
+    def _visible_element(self, locator, clickable=False):
+        # One round-trip when the element is already there (the common case),
+        # otherwise the same call resolves the moment it shows up
+        return self._wait_for(locator, "clickable" if clickable else "visible")
+
+    def _read(self, locator, what, name=None):
+        # Fast path: locate + check + read in one call
+        result = self.driver.execute_script(_READ_JS, locator[0], locator[1], what, name)
+        if result["ready"]:
+            return result["value"]
+        element = self._wait_for(locator, "visible")
+        if what == "text":
+            return element.text
+        return element.get_attribute(name or "value")
+
     def clickit(self, locator):
         # traditional / naive way of above
         # WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(locator))
         # element = self.driver.find_element(*locator)
         # element.click()
-        self.wait.until(EC.element_to_be_clickable(locator)).click()
-        
+        self._visible_element(locator, clickable=True).click()
+
     def typeit(self, locator, text):
         # traditional / naive way of above
         # element = self.driver.find_element(*locator)
         # WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(locator))
         # element.send_keys(text)
-        self.wait.until(EC.visibility_of_element_located(locator)).clear()
-        self.driver.find_element(*locator).send_keys(text)
-    
+        # 🔧 UPDATED: reuse the element returned by the wait instead of finding it again
+        element = self._visible_element(locator)
+        element.clear()
+        element.send_keys(text)
+
     def get_element_text(self, locator):
         # traditional / naive way of below line
         # driver = self.driver
         # WebDriverWait(driver, 10).until(EC.visibility_of_element_located(locator))
         # element = driver.find_element(*locator)
         # return element.text
-        self.wait.until(EC.visibility_of_element_located(locator))
-        return self.driver.find_element(*locator).text
-    
+        return self._read(locator, "text")
+
     def get_value_of_element(self, locator):
         # traditional / naive way of below line
         # driver = self.driver
         # WebDriverWait(driver, 10).until(EC.visibility_of_element_located(locator))
         # element = driver.find_element(*locator)
         # return element.get_attribute("value")
-        self.wait.until(EC.visibility_of_element_located(locator))
-        return self.driver.find_element(*locator).get_attribute("value")
-    
-    
+        return self._read(locator, "value")
+
+
     def is_visible(self, locator):
         try:
-            return self.wait.until(EC.visibility_of_element_located(locator)).is_displayed()
+            # the wait only ever returns elements that are displayed
+            return self._visible_element(locator) is not None
         except Exception:
             return False
         # traditional / naive way of below line
@@ -58,39 +161,81 @@ class BasePage:
         # element = driver.find_element(*locator)
         # return element.is_displayed()
 
+    def is_hidden(self, locator, timeout=None):
+        # Fast "expect absent/hidden" path: True the moment the element is hidden or removed.
+        # Research note: `not is_visible(...)` waits the full explicit_wait before it can say False.
+        try:
+            return self._wait_for(locator, "hidden", timeout)
+        except TimeoutException:
+            return False
+
     def accept_the_alert(self):
         alert = self.switch_to_alert()
         alert.accept()
         # Research note: No need to return anything here as accept() does not return any value.
-    
+
     def navigate_to(self, url):
         self.driver.get(url)
-    
+
     def get_page_title(self):
         return self.driver.title
-    
+
     def switch_to_alert(self):
         return self.driver.switch_to.alert
-    
+
     def get_element_attribute(self, locator, attribute_name):
         # Traditional / naive way of above lines
         # driver = self.driver <-- redundant
         # WebDriverWait(driver, 10).until(EC.visibility_of_element_located(locator)) <-- redundant
         # element = driver.find_element(*locator) <-- redundant
         # return element.get_attribute(attribute_name)
-        self.wait.until(EC.visibility_of_element_located(locator))
-        return self.driver.find_element(*locator).get_attribute(attribute_name)
-        
+        return self._read(locator, "attribute", attribute_name)
+
+    # Batched reads: one execute_script for any number of locators (None for hidden/missing elements)
+    def get_texts_of_elements(self, locators):
+        return self.driver.execute_script(_READ_MANY_JS, [list(locator) for locator in locators], "text", None)
+
+    def get_values_of_elements(self, locators):
+        return self.driver.execute_script(_READ_MANY_JS, [list(locator) for locator in locators], "value", None)
+
+    def get_attributes_of_elements(self, locators, attribute_name):
+        return self.driver.execute_script(
+            _READ_MANY_JS, [list(locator) for locator in locators], "attribute", attribute_name
+        )
+
     def find_elements(self, locator):
         # self.wait.until(lambda driver: len(driver.find_elements(*locator)) > 0)
-        self.wait.until(EC.presence_of_all_elements_located(locator))
-        return self.driver.find_elements(*locator)
-        
+        # 🔧 UPDATED: the wait already returns the elements, no second find_elements
+        return self._wait_for(locator, "all_present")
+
     def pick_and_click_from_list(self, elements, text_to_select):
-        for element in elements:
-            if element.text == text_to_select:
-                element.click()
-                break
-            
+        # traditional / naive way of below line (one .text round-trip per element)
+        # for element in elements:
+        #     if element.text == text_to_select:
+        #         element.click()
+        #         break
+        # 🔧 UPDATED: the whole list is matched and clicked inside the browser in one call
+        return self._select_from_list(elements, text_to_select, "exact")
+
+    def select_from_list(self, locator, text_to_select, match="exact"):
+        # Finds the list by locator and clicks the matching item, all in ONE execute_script.
+        # match: "exact", "prefix" or "ignore_case"
+        return self._select_from_list(list(locator), text_to_select, match)
+
+    def _select_from_list(self, source, text_to_select, match):
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode '{match}', expected one of {MATCH_MODES}")
+        result = self.driver.execute_script(_SELECT_FROM_LIST_JS, source, text_to_select, match)
+        if result["covered"]:
+            raise ElementClickInterceptedException(
+                f"List item '{result['text']}' is covered by another element and cannot be clicked"
+            )
+        if not result["clicked"]:
+            raise NoSuchElementException(
+                f"No visible list item matching '{text_to_select}' ({match}). "
+                f"Visible candidates: {result['candidates']}"
+            )
+        return result["text"]
+
     def refresh_page(self):
-        self.driver.refresh()
\ No newline at end of file
+        self.driver.refresh()
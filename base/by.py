@@ -0,0 +1,13 @@
+# Intention: Locator strategies without importing selenium.webdriver.
+# `from selenium.webdriver.common.by import By` runs selenium/webdriver/__init__.py, which loads
+# every browser driver (~150 ms) just to read a few constants. The values are the W3C strategy
+# names, identical to selenium's By, so locators work unchanged with find_element and LOCATE_JS.
+class By:
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
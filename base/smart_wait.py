@@ -0,0 +1,180 @@
+import time
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+# Intention: Waits that return as soon as the condition becomes true.
+# Research note: WebDriverWait checks the condition, sleeps 0.5 s, checks again...
+# So an element that appears 10 ms after the first check still costs ~0.5 s.
+# SmartWait runs ONE async script in the page: it checks the condition immediately, then a
+# MutationObserver re-checks on every DOM change and calls back the moment it is true.
+# If the script cannot run (navigation, unsupported locator), it falls back to polling that
+# starts at 50 ms and backs off to 500 ms.
+
+# Shared JS helpers: locate an element from a Selenium locator tuple and check visibility
+LOCATE_JS = """
+function locate(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'css selector': return document.querySelector(value);
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'xpath': return document.evaluate(value, document, null,
+                                               XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function locateAll(by, value) {
+    switch (by) {
+        case 'id': var byId = document.getElementById(value); return byId ? [byId] : [];
+        case 'name': return Array.prototype.slice.call(document.getElementsByName(value));
+        case 'css selector': return Array.prototype.slice.call(document.querySelectorAll(value));
+        case 'class name': return Array.prototype.slice.call(document.getElementsByClassName(value));
+        case 'tag name': return Array.prototype.slice.call(document.getElementsByTagName(value));
+        case 'xpath':
+            var snap = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var found = [];
+            for (var s = 0; s < snap.snapshotLength; s++) { found.push(snap.snapshotItem(s)); }
+            return found;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function isVisible(el) {
+    if (!el) { return false; }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' &&
+           !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+function read(el, what, name) {
+    if (what === 'text') { return el.innerText; }
+    if (what === 'value') { return el.value; }
+    var prop = el[name];
+    return (prop !== undefined && prop !== null && typeof prop !== 'object' && typeof prop !== 'function')
+        ? String(prop) : el.getAttribute(name);
+}
+"""
+
+_WAIT_FOR_STATE_JS = LOCATE_JS + """
+var by = arguments[0], value = arguments[1], state = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function check() {
+    if (state === 'all_present') {
+        var all = locateAll(by, value);
+        return all.length ? all : null;
+    }
+    var el = locate(by, value);
+    if (state === 'present') { return el; }
+    if (state === 'visible') { return isVisible(el) ? el : null; }
+    if (state === 'clickable') { return (isVisible(el) && !el.disabled) ? el : null; }
+    if (state === 'hidden') { return isVisible(el) ? null : true; }
+    throw new Error('Unsupported wait state: ' + state);
+}
+
+var first = check();
+if (first !== null) { return done({ok: true, value: first}); }
+
+var finished = false, observer, timer, backup;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(backup);
+    done({ok: result !== null, value: result});
+}
+function recheck() {
+    if (finished) { return; }
+    var result = check();
+    if (result !== null) { finish(result); }
+}
+observer = new MutationObserver(recheck);
+observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+// CSS transitions/animations can change visibility without any DOM mutation -> cheap backup check
+backup = setInterval(recheck, 100);
+timer = setTimeout(function () { finish(null); }, timeoutMs);
+"""
+
+# Fallback expected conditions for each state (used when the async script cannot run).
+# Names only: selenium.webdriver.support imports the whole selenium.webdriver package, which
+# would make every `import pages...` (and so test collection) pay for it.
+_FALLBACK_CONDITIONS = {
+    "present": "presence_of_element_located",
+    "all_present": "presence_of_all_elements_located",
+    "visible": "visibility_of_element_located",
+    "clickable": "element_to_be_clickable",
+    "hidden": "invisibility_of_element_located",
+}
+
+
+def _fallback_condition(state, locator):
+    from selenium.webdriver.support import expected_conditions as EC
+    return getattr(EC, _FALLBACK_CONDITIONS[state])(locator)
+
+# Research note: chromedriver's default script timeout is 30 s, so one async script never
+# waits longer than this slice. Longer waits simply run several slices back to back.
+_MAX_SCRIPT_SLICE = 10.0
+
+
+class SmartWait:
+    def __init__(self, driver, timeout, poll_start=0.05, poll_max=0.5):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_start = poll_start
+        self.poll_max = poll_max
+        self.ignored_exceptions = (NoSuchElementException, StaleElementReferenceException)
+
+    def until_state(self, locator, state, timeout=None):
+        # state: present / all_present / visible / clickable / hidden
+        timeout = self.timeout if timeout is None else timeout
+        end = time.monotonic() + timeout
+        while True:
+            remaining = max(0.0, end - time.monotonic())
+            slice_ms = int(min(remaining, _MAX_SCRIPT_SLICE) * 1000)
+            try:
+                result = self.driver.execute_async_script(
+                    _WAIT_FOR_STATE_JS, locator[0], locator[1], state, slice_ms
+                )
+            except (JavascriptException, TimeoutException):
+                # e.g. the page is navigating -> fall back to adaptive polling for the time left
+                return self.until(_fallback_condition(state, locator), timeout=max(0.0, end - time.monotonic()),
+                                  message=f"Element {locator} not {state} after {timeout}s")
+            if result["ok"]:
+                return result["value"]
+            if time.monotonic() >= end:
+                raise TimeoutException(f"Element {locator} not {state} after {timeout}s")
+
+    def until(self, condition, timeout=None, message=""):
+        # Same contract as WebDriverWait.until, but with adaptive polling (50 ms -> 500 ms)
+        # Conditions may call find_element: with an implicit wait every poll could block for
+        # the whole implicit_wait, so it is off while polling and restored afterwards
+        implicit_wait = getattr(self.driver, "configured_implicit_wait", 0)
+        if not implicit_wait:
+            return self._poll(condition, timeout, message)
+        self.driver.implicitly_wait(0)
+        try:
+            return self._poll(condition, timeout, message)
+        finally:
+            self.driver.implicitly_wait(implicit_wait)
+
+    def _poll(self, condition, timeout, message):
+        timeout = self.timeout if timeout is None else timeout
+        end = time.monotonic() + timeout
+        interval = self.poll_start
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    return value
+            except self.ignored_exceptions:
+                pass
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message)
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self.poll_max)
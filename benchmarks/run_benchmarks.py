@@ -0,0 +1,188 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# Intention: Micro-benchmarks for the page-action layer (BasePage, PracticePage, flows).
+# Every operation runs many times against the bundled local replica page (no network noise),
+# and we record p50/p95 latency plus the number of WebDriver round-trips per operation.
+# Compare against benchmarks/baseline.json and fail when something got slower.
+#
+#   python -m benchmarks.run_benchmarks                     # compare with the baseline
+#   python -m benchmarks.run_benchmarks --update-baseline   # accept the current numbers
+#
+# Research note: is_visible on a hidden element waits the full explicit_wait. The benchmark uses
+# its own --explicit-wait (default 1 s) so that case stays measurable; the number to watch is
+# the overhead on top of that wait, and any change in it shows up as a regression.
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Page-action micro-benchmarks with regression thresholds")
+    parser.add_argument("--iterations", type=int, default=20, help="Runs per operation (default 20)")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Allowed latency regression vs baseline, 0.20 = 20%% (default)")
+    parser.add_argument("--explicit-wait", type=int, default=1, help="explicit_wait used by the page objects")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--browser-profile", default=None, help="Launch profile from config.ini")
+    return parser.parse_args()
+
+
+def build_operations(page):
+    from flows.alert_flow import AlertFlow
+    from flows.autosuggestions_flow import AutoSuggestionsFlow
+
+    def show_textbox():
+        page.click_show_button()
+
+    def hide_textbox():
+        page.click_hide_button()
+
+    # name -> (setup, operation); setup is not timed
+    return {
+        "clickit": (None, lambda: page.clickit(page.SHOW_BUTTON)),
+        "typeit": (show_textbox, lambda: page.typeit(page.TEXTBOX, "Haryish")),
+        "is_visible[true]": (show_textbox, lambda: page.is_visible(page.TEXTBOX)),
+        "is_visible[false]": (hide_textbox, lambda: page.is_visible(page.TEXTBOX)),
+        "is_hidden[true]": (hide_textbox, lambda: page.is_hidden(page.TEXTBOX)),
+        "select_country_from_autosuggestions": (
+            None, lambda: AutoSuggestionsFlow(page).select_country_from_autosuggestions("ind", "India")
+        ),
+        "submit_name_and_get_alert_message": (
+            None, lambda: AlertFlow(page).submit_name_and_get_alert_message("Haryish")
+        ),
+    }
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def run(args):
+    # The page objects read explicit_wait from the config snapshot, so set it before the first load_config()
+    os.environ["AUT_EXPLICIT_WAIT"] = str(args.explicit_wait)
+
+    from pages.practice_page import PracticePage
+    from utils import driver_profiler
+    from utils.config_reader import load_config, load_profile, set_active_env
+    from utils.driver_factory import create_driver
+    from utils.local_site import LocalSiteServer
+    from utils.page_reset import PageResetEngine
+
+    set_active_env("local")
+    config = load_config("local")
+    profile = load_profile(args.browser_profile) if args.browser_profile else None
+    profiler = driver_profiler.enable()
+
+    server = LocalSiteServer().start()
+    driver = driver_profiler.instrument(create_driver(config, headless=not args.headed, profile=profile))
+    results = {}
+    try:
+        driver.get(server.url)
+        reset = PageResetEngine(driver)
+        reset.snapshot()
+        page = PracticePage(driver)
+
+        for name, (setup, operation) in build_operations(page).items():
+            latencies, round_trips = [], []
+            for _ in range(args.iterations):
+                reset.reset("soft")
+                if setup:
+                    setup()
+                profiler.start_test(name)
+                started = time.perf_counter()
+                operation()
+                latencies.append((time.perf_counter() - started) * 1000)
+                round_trips.append(profiler.finish_test()["round_trips"])
+            results[name] = {
+                "p50_ms": round(percentile(latencies, 0.50), 2),
+                "p95_ms": round(percentile(latencies, 0.95), 2),
+                "mean_ms": round(statistics.mean(latencies), 2),
+                "round_trips": statistics.median(round_trips),
+            }
+            print(f"{name:<40} p50 {results[name]['p50_ms']:>9.2f} ms   p95 {results[name]['p95_ms']:>9.2f} ms"
+                  f"   round-trips {results[name]['round_trips']}")
+    finally:
+        driver.quit()
+        server.stop()
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            limit = previous[metric] * (1 + threshold)
+            if current[metric] > limit:
+                regressions.append(f"{name} {metric}: {current[metric]} ms > {limit:.2f} ms "
+                                   f"(baseline {previous[metric]} ms + {threshold:.0%})")
+        # Round-trips are deterministic, so any increase is a regression
+        if current["round_trips"] > previous["round_trips"]:
+            regressions.append(f"{name} round_trips: {current['round_trips']} > baseline {previous['round_trips']}")
+    return regressions
+
+
+# Settings stored with the baseline that must match the current run: is_visible[false] is
+# dominated by explicit_wait, and fewer iterations make p95 a different statistic
+BASELINE_SETTINGS = ("explicit_wait", "iterations")
+
+
+def settings_mismatch(baseline, args):
+    return [f"{name}: baseline {baseline.get(name)}, this run {getattr(args, name)}"
+            for name in BASELINE_SETTINGS if baseline.get(name) != getattr(args, name)]
+
+
+def load_baseline(args):
+    # (baseline, error message); checked before the run so a useless run is not even started
+    if not os.path.exists(args.baseline):
+        return None, f"No baseline at {args.baseline}; run with --update-baseline first"
+    with open(args.baseline, "r") as file:
+        baseline = json.load(file)
+    mismatch = settings_mismatch(baseline, args)
+    if mismatch:
+        return None, ("Baseline was recorded with different settings, results are not comparable:\n  "
+                      + "\n  ".join(mismatch) + "\nRun with the baseline's settings or --update-baseline")
+    return baseline, None
+
+
+def main():
+    args = parse_args()
+    baseline = None
+    if not args.update_baseline:
+        baseline, error = load_baseline(args)
+        if error:
+            print(error)
+            return 2
+    results = run(args)
+
+    if args.update_baseline:
+        payload = {"iterations": args.iterations, "explicit_wait": args.explicit_wait, "operations": results}
+        with open(args.baseline, "w") as file:
+            json.dump(payload, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline["operations"], args.threshold)
+    if regressions:
+        print("\nREGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
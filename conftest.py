@@ -1,16 +1,33 @@
-import datetime
+import time
+_CONFTEST_IMPORT_STARTED = time.perf_counter()
+
+import json
 import os
-import allure
+import statistics
+import sys
+from datetime import datetime
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from utils.config_reader import ConfigReader
+from utils import driver_profiler, page_metrics
+from utils.browser_pool import BrowserPool
+from utils.config_reader import get_config, load_config, load_profile, set_active_env
+from utils.datareader import DataSource, LazyRow
+from utils.local_site import LocalSiteServer
+from utils.page_reset import PageResetEngine
+from utils.screenshots import close_writer, get_writer
 from pages.practice_page import PracticePage
-from utils.logger import get_logger
+from flows.autosuggestions_flow import AutoSuggestionsFlow
+from utils.logger import clear_test_context, get_logger, set_test_context, shutdown_logging, worker_id
+
+logger = get_logger()           # 🔧 UPDATED: logger instance (the log file is only created by the first record)
+CONFTEST_IMPORT_MS = (time.perf_counter() - _CONFTEST_IMPORT_STARTED) * 1000
 
-logger = get_logger()           # 🔧 UPDATED: logger instance
-ACTIVE_DRIVER = None            # 🔧 UPDATED: global driver reference
+# 🔧 UPDATED: fast collection. selenium.webdriver, webdriver_manager and allure are imported inside
+# the fixtures/hooks that use them, so --collect-only and -k selections never load them.
+# --startup-report shows where startup time goes and which heavy modules got loaded anyway.
+HEAVY_MODULES = ("selenium.webdriver", "webdriver_manager", "allure", "PIL")
+# pytest plugins load before conftest (allure-pytest imports allure itself) - not ours to defer
+PRELOADED_MODULES = [name for name in HEAVY_MODULES if name in sys.modules]
+STARTUP_TIMINGS = {}
 
 # Add command line option to specify environment
 def pytest_addoption(parser):
@@ -18,7 +35,7 @@ def pytest_addoption(parser):
         "--env",
         action="store",
         default="default",
-        help="Environment to run tests against (default/uat/prod)"
+        help="Environment to run tests against (default/uat/prod/local)"
     )
     # Argument 1: --env - specifies the environment
     # Argument 2: action - store the value provided (means that the value will be stored)
@@ -29,56 +46,281 @@ def pytest_addoption(parser):
         action="store_true",
         help="Run tests in headless mode"
     )
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=None,
+        help="Browser launch profile from config.ini, e.g. fast or fidelity (default: browser_profile key)"
+    )
+    parser.addoption(
+        "--row-mode",
+        action="store",
+        default="per_row",
+        choices=("per_row", "batch"),
+        help="Data-driven autosuggestion rows: one page reset per row (per_row) or all rows on one page (batch)"
+    )
+    parser.addoption(
+        "--reuse-browser",
+        action="store_true",
+        help="Keep browsers alive between runs in a local chromedriver daemon and reattach to them"
+    )
+    parser.addoption(
+        "--page-metrics",
+        action="store_true",
+        help="Record Navigation/Resource Timing and long tasks after every page load (reports/page_metrics/)"
+    )
+    parser.addoption(
+        "--startup-report",
+        action="store_true",
+        help="Report conftest import and collection time plus heavy modules loaded during collection"
+    )
+    parser.addoption(
+        "--profile-driver",
+        action="store_true",
+        help="Record every WebDriver command and wait per test and page-object method"
+    )
+    parser.addoption(
+        "--record-durations",
+        action="store",
+        default=None,
+        help="Write {test id: seconds} to this JSON file (used by run_test.py --shards to balance shards)"
+    )
 
-# Fixture to initialize and provide WebDriver instance
-@pytest.fixture(scope="class")
-def driver(request):
-    #🔧 UPDATED: global driver reference
-    global ACTIVE_DRIVER    
+def pytest_configure(config):
+    # 🔧 UPDATED: one config snapshot per process, shared by fixtures and page objects
+    set_active_env(config.getoption("--env"))
+    config.addinivalue_line(
+        "markers",
+        "page_reset(strategy): how the page is reset before the test - soft (default), reload or none"
+    )
+    config.addinivalue_line(
+        "markers",
+        "data_source(path, argname, schema=None): parametrize argname with the rows of a csv/json/jsonl file"
+    )
+    config.addinivalue_line(
+        "markers",
+        "row_mode(mode): only run with --row-mode=<mode> (per_row or batch)"
+    )
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run every test of the group on the same xdist worker (--dist loadgroup)"
+    )
+    if config.getoption("--profile-driver"):
+        driver_profiler.enable()
+    if config.getoption("--page-metrics"):
+        # Same run id in the controller and every xdist worker (workers inherit the environment)
+        os.environ.setdefault(page_metrics.RUN_ID_VARIABLE, datetime.now().strftime("%Y%m%d-%H%M%S"))
+
+# 🔧 UPDATED: data-driven parametrization from @pytest.mark.data_source (utils/datareader.py)
+# Only the row count is needed here; each row is parsed when its test actually uses it.
+def pytest_generate_tests(metafunc):
+    marker = metafunc.definition.get_closest_marker("data_source")
+    if marker is None:
+        return
+    path = marker.args[0]
+    argname = marker.kwargs.get("argname") or marker.args[1]
+    if not os.path.isabs(path):
+        path = os.path.join(str(metafunc.config.rootpath), path)
 
-    # Get environment from command line option
-    env = request.config.getoption("--env")  
+    source = DataSource(path, schema=marker.kwargs.get("schema"))
+    rows = source.lazy_rows()
+    metafunc.parametrize(argname, rows, ids=[f"{argname}{row.number}" for row in rows])
+
+# --row-mode: per-row tests and their batch alternative cover the same rows, only one of them runs
+def pytest_collection_modifyitems(config, items):
+    mode = config.getoption("--row-mode")
+    selected, deselected = [], []
+    for item in items:
+        marker = item.get_closest_marker("row_mode")
+        (deselected if marker and marker.args[0] != mode else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+# Launch profile ([profile:<name>] in config.ini): --browser-profile wins over the config key
+@pytest.fixture(scope="session")
+def launch_profile(request):
+    name = request.config.getoption("--browser-profile") or get_config().values.get("browser_profile")
+    return load_profile(name) if name else None
+
+# 🔧 UPDATED: session-level browser pool (one per worker process) replaces the global driver
+@pytest.fixture(scope="session")
+def browser_pool(request, launch_profile):
     headless = request.config.getoption("--headless")
 
-    # Initialize WebDriver
-    service = Service(ChromeDriverManager().install())
-    options = webdriver.ChromeOptions()
-    
-    if headless:
-        options.add_argument("--headless-new")
-        options.add_argument("--window-size=1920,1080")        
-    
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.maximize_window()
-
-    # Read base URL from config based on environment
-    config = ConfigReader(env=env)
-    base_url = config.get("base_url")
-    driver.get(base_url)
-
-    # attach driver for hooks
-    request.node.driver = driver
-    ACTIVE_DRIVER = driver
-
-    # ❌ DO NOT quit here
+    # instrument() is a no-op unless --profile-driver is on
+    config = get_config()
+    if request.config.getoption("--reuse-browser"):
+        # Browsers live in utils/browser_daemon.py; pool.close() only detaches from them
+        from utils import browser_daemon
+        launch = lambda: browser_daemon.attach_or_launch(config, headless=headless, profile=launch_profile,
+                                                         logger=logger)
+    else:
+        from utils.driver_factory import create_driver
+        launch = lambda: create_driver(config, headless=headless, profile=launch_profile)
+    # size=1: classes in a worker run one after another, so one warm browser per worker is enough
+    pool = BrowserPool(lambda: driver_profiler.instrument(launch()), size=1)
+    profile_name = launch_profile.name if launch_profile else "none"
+    logger.info(f"Browser pool ready on worker {worker_id()} (profile={profile_name})")
+
+    yield pool
+
+    # session-level teardown: quit every browser the pool launched
+    closed, errors = pool.close()
+    logger.info(f"Browser pool closed on worker {worker_id()} ({closed} browser(s) quit)")
+    for e in errors:
+        logger.warning(f"Failed to quit browser at session end: {e}")
+
+# Session-level local replica of the practice page (only started for --env=local)
+@pytest.fixture(scope="session")
+def local_site(request):
+    if request.config.getoption("--env") != "local":
+        yield None
+        return
+
+    config = load_config("local")
+    port = int(config.get("local_server_port"))
+    if port == 0 and request.config.getoption("--reuse-browser"):
+        # A reused browser can only skip the initial load when the URL is the same as last run:
+        # fixed port per worker (gw0 -> +0, gw1 -> +1, ...)
+        worker = worker_id()
+        port = int(config.get("local_server_reuse_port")) + (int(worker[2:]) if worker.startswith("gw") else 0)
+    try:
+        server = LocalSiteServer(port=port).start()
+    except OSError as e:
+        # Port taken (e.g. a second run at the same time) -> any free port
+        logger.warning(f"Local site port {port} unavailable ({e}), using a free port")
+        server = LocalSiteServer(port=0).start()
+    logger.info(f"Local practice site serving at {server.url}")
+    yield server.url
+    server.stop()
+
+# Page performance time series per env, only with --page-metrics
+@pytest.fixture(scope="session")
+def page_metrics_recorder(request):
+    if not request.config.getoption("--page-metrics"):
+        return None
+    config = get_config()
+    return page_metrics.PageMetricsRecorder(config.env, budget_ms=page_metrics.load_budget(config.env))
+
+def record_page_metrics(request, recorder, driver, kind):
+    try:
+        metrics = page_metrics.collect(driver)
+    except Exception as e:
+        logger.warning(f"Could not read page metrics: {e}")
+        return
+    if not metrics:
+        return
+    import allure
+    entry = recorder.record(request.node.nodeid, kind, metrics)
+    load = entry["navigation"]["load"]
+    if entry["over_budget"]:
+        logger.warning(f"Page load {load} ms is over the {recorder.budget_ms} ms budget ({kind} load)")
+
+    # Allure metadata: a label to filter on, plus the full entry
+    allure.dynamic.label("page_load_ms", str(load))
+    allure.attach(
+        json.dumps(entry, indent=2),
+        name=f"page_metrics_{kind}",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+# Time-to-interactive of every initial page load, reported per launch profile at the end of the run
+PAGE_LOAD_TIMINGS = []
+
+def record_page_load(driver, launch_profile):
+    from utils.driver_factory import time_to_interactive
+    try:
+        timing = time_to_interactive(driver)
+    except Exception as e:
+        logger.warning(f"Could not read navigation timing: {e}")
+        return
+    if timing:
+        timing["profile"] = launch_profile.name if launch_profile else "none"
+        PAGE_LOAD_TIMINGS.append(timing)
+        logger.info(f"Page load ({timing['profile']} profile): interactive {timing['interactive']} ms, "
+                    f"DOMContentLoaded {timing['dom_content_loaded']} ms, load {timing['load']} ms")
+
+# Fixture to lease a WebDriver instance from the pool
+@pytest.fixture(scope="class")
+def driver(request, browser_pool, local_site, launch_profile, page_metrics_recorder):
+    driver = browser_pool.lease()
+    try:
+        if page_metrics_recorder:
+            page_metrics.install_observers(driver)
+
+        # Read base URL from config based on environment (--env, resolved once in pytest_configure)
+        # (--env=local -> URL of the in-process replica server)
+        base_url = local_site or get_config().base_url
+        reused = False
+        if request.config.getoption("--reuse-browser"):
+            from utils.browser_daemon import is_warm
+            reused = is_warm(driver, base_url)
+        if reused:
+            # --reuse-browser: handed back on a restored page, the initial load can be skipped
+            logger.info(f"Reusing the loaded page {base_url}, initial load skipped")
+        else:
+            driver.get(base_url)
+            if request.config.getoption("--reuse-browser"):
+                from utils.browser_daemon import mark_loaded
+                mark_loaded(driver, base_url)
+            record_page_load(driver, launch_profile)
+            # --page-metrics: stored for the first test of the class (tests own the records)
+            driver.page_metrics_pending = True
+
+        # attach driver for hooks
+        request.node.driver = driver
+    except BaseException:
+        # Setup failed (e.g. the initial load timed out): the teardown below never runs,
+        # so hand the browser back here or the next lease() waits for it forever
+        browser_pool.release(driver, healthy=browser_pool.is_healthy(driver))
+        raise
+
     yield driver
-    
-@pytest.fixture(autouse=True)
-def refresh_page(driver):
-    # Read base URL from config based on environment
-    driver.refresh()
-    
-# UPDATED: session-level teardown
-@pytest.fixture(scope="session", autouse=True)
-def quit_browser_session():
-    yield
-    global ACTIVE_DRIVER
-    if ACTIVE_DRIVER:
+
+    # 🔧 UPDATED: give the browser back instead of quitting it (a warm browser for the next class).
+    # A crashed browser is discarded, so the next class gets a freshly launched one.
+    healthy = browser_pool.is_healthy(driver)
+    if not healthy:
+        logger.warning(f"Browser on worker {worker_id()} is not responding, discarding it")
+    browser_pool.release(driver, healthy=healthy)
+
+# Snapshot of the freshly loaded page, taken once per class
+@pytest.fixture(scope="class")
+def page_reset(request, driver):
+    engine = PageResetEngine(driver, logger=logger)
+    engine.snapshot()
+    yield engine
+
+    # --reuse-browser: restore the page before the browser is handed back, so the next
+    # class (or the next pytest run) can use it without loading it again
+    if request.config.getoption("--reuse-browser"):
+        from utils.browser_daemon import mark_clean
         try:
-            ACTIVE_DRIVER.quit()
-            logger.info("Browser quit at session end")
+            engine.reset("soft")
+            mark_clean(driver)
         except Exception as e:
-            logger.warning(f"Failed to quit browser at session end: {e}")
+            logger.warning(f"Could not restore the page before handing the browser back: {e}")
+
+@pytest.fixture(autouse=True)
+def refresh_page(request, page_metrics_recorder):
+    # 🔧 UPDATED: restore the snapshot in-page instead of a full driver.refresh() per test.
+    # Opt out per test/class with @pytest.mark.page_reset("reload") or ("none")
+    # Tests that never use a browser (tests/unit) do not start one
+    if "driver" not in request.fixturenames:
+        return
+    page_reset = request.getfixturevalue("page_reset")
+    marker = request.node.get_closest_marker("page_reset")
+    strategy = marker.args[0] if marker else "soft"
+    result = page_reset.reset(strategy)
+
+    if page_metrics_recorder:
+        driver = page_reset.driver
+        if result == "reload":
+            record_page_metrics(request, page_metrics_recorder, driver, "reload")
+        elif getattr(driver, "page_metrics_pending", False):
+            record_page_metrics(request, page_metrics_recorder, driver, "initial")
+        driver.page_metrics_pending = False
 
 # Helper Functions for Test Reporting and Screenshots
 def log_test_outcome(rep, item):
@@ -92,26 +334,25 @@ def log_test_outcome(rep, item):
         logger.info(f"TEST PASSED: {item.name}")
 
 def capture_screenshot(item):
+    if "driver" not in item.fixturenames:
+        return
+    import allure
     try:
-        global ACTIVE_DRIVER
-        driver = ACTIVE_DRIVER
+        # 🔧 UPDATED: use the browser leased by this test, not a global one
+        driver = item.funcargs.get("driver")
         if not driver:
             logger.warning("Driver not available for screenshot")
             return
 
-        screenshot_dir = "screenshots"
-        os.makedirs(screenshot_dir, exist_ok=True)
+        # Batch rows already captured the page at the moment the row failed
+        batch_result = item.funcargs.get("batch_result")
+        if batch_result and batch_result.get("screenshot"):
+            png = batch_result["screenshot"]
+        else:
+            # 🔧 UPDATED: capture ONCE, the same bytes go to Allure and to disk
+            png = driver.get_screenshot_as_png()
 
-        # Generate timestamped screenshot filename for HTML report
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = os.path.join(
-            screenshot_dir, f"{item.name}_{timestamp}.png"
-        )
-        driver.save_screenshot(screenshot_path)
-        logger.info(f"Screenshot saved to {screenshot_path}")
-        
         # Attach screenshot to Allure report
-        png = driver.get_screenshot_as_png()
         allure.attach(
             png,
             name=f"{item.name}_failure",
@@ -119,13 +360,149 @@ def capture_screenshot(item):
         )
         logger.info("Screenshot attached to Allure report")
 
+        # Disk write, dedupe and retention happen on the background writer thread
+        get_writer(logger=logger).submit(item.name, png)
+
     except Exception as e:
         logger.error(f"Failed to capture screenshot: {e}")
 
+def report_driver_profile(item):
+    profiler = driver_profiler.ACTIVE
+    if profiler is None:
+        return
+    summary = profiler.finish_test()
+    if summary is None:
+        return
+    import allure
+    text = driver_profiler.format_summary(summary)
+    logger.info(text)
+    allure.attach(
+        text,
+        name=f"{item.name}_driver_profile",
+        attachment_type=allure.attachment_type.TEXT
+    )
+
 def log_skipped_test(rep, item):
     if rep.when == "setup" and rep.skipped:
         logger.warning(f"TEST SKIPPED: {item.name}")
 
+# Start attributing log records and WebDriver commands to this test (setup + call phase)
+def pytest_runtest_setup(item):
+    set_test_context(item.nodeid)
+    if driver_profiler.ACTIVE is not None:
+        driver_profiler.ACTIVE.start_test(item.nodeid)
+
+def pytest_runtest_logfinish(nodeid, location):
+    clear_test_context()
+
+# Per-test durations (setup + call + teardown) for --record-durations
+TEST_DURATIONS = {}
+
+def pytest_runtest_logreport(report):
+    TEST_DURATIONS[report.nodeid] = TEST_DURATIONS.get(report.nodeid, 0.0) + report.duration
+
+def pytest_sessionfinish(session):
+    # xdist worker: terminal output of workers is never shown, so hand the end-of-run tables
+    # to the controller (received in pytest_testnodedown) and let it print them
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["page_load_timings"] = PAGE_LOAD_TIMINGS
+        if driver_profiler.ACTIVE is not None:
+            workeroutput["driver_profile"] = driver_profiler.ACTIVE.export_session()
+        return
+
+    path = session.config.getoption("--record-durations")
+    # Under xdist the controller receives every report, so only it writes the file
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as file:
+        json.dump({nodeid: round(seconds, 3) for nodeid, seconds in TEST_DURATIONS.items()}, file, indent=2)
+
+# Flush the background screenshot and log writers before the process exits
+def pytest_unconfigure(config):
+    close_writer()
+    shutdown_logging()
+
+# xdist controller: collect what every worker sent from pytest_sessionfinish
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", None) or {}
+    PAGE_LOAD_TIMINGS.extend(output.get("page_load_timings", []))
+    if driver_profiler.ACTIVE is not None and output.get("driver_profile"):
+        driver_profiler.ACTIVE.merge_session(output["driver_profile"])
+
+def report_page_load_timings(terminalreporter):
+    if not PAGE_LOAD_TIMINGS:
+        return
+    terminalreporter.write_sep("=", "Page load timing per launch profile")
+    for name in sorted({timing["profile"] for timing in PAGE_LOAD_TIMINGS}):
+        timings = [timing for timing in PAGE_LOAD_TIMINGS if timing["profile"] == name]
+        line = (f"{name}: {len(timings)} load(s), median interactive "
+                f"{statistics.median(t['interactive'] for t in timings):.0f} ms, DOMContentLoaded "
+                f"{statistics.median(t['dom_content_loaded'] for t in timings):.0f} ms, load "
+                f"{statistics.median(t['load'] for t in timings):.0f} ms")
+        terminalreporter.write_line(line)
+        logger.info(f"Page load timing - {line}")
+
+def report_page_metrics(terminalreporter):
+    config = terminalreporter.config
+    # Under xdist the controller aggregates what every worker appended for this run
+    if not config.getoption("--page-metrics") or "PYTEST_XDIST_WORKER" in os.environ:
+        return
+    env = get_config().env
+    recorder = page_metrics.PageMetricsRecorder(env)
+    entries = page_metrics.read_entries(recorder.path, run_id=recorder.run_id)
+    if not entries:
+        return
+    summaries = page_metrics.summarize(entries, {env: page_metrics.load_budget(env)})
+    terminalreporter.write_sep("=", f"Page metrics ({recorder.path})")
+    for name, summary in summaries.items():
+        line = page_metrics.format_summary(name, summary)
+        terminalreporter.write_line(line, red=summary["exceeded"])
+        if summary["exceeded"]:
+            logger.warning(f"Page metrics - {line}")
+        else:
+            logger.info(f"Page metrics - {line}")
+
+# --startup-report: conftest import time, collection time and heavy imports done by collection
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection(session):
+    STARTUP_TIMINGS["collection_started"] = time.perf_counter()
+
+def pytest_collection_finish(session):
+    STARTUP_TIMINGS["collection_ms"] = (time.perf_counter() - STARTUP_TIMINGS["collection_started"]) * 1000
+    STARTUP_TIMINGS["heavy_modules"] = [name for name in HEAVY_MODULES
+                                        if name in sys.modules and name not in PRELOADED_MODULES]
+    STARTUP_TIMINGS["items"] = len(session.items)
+
+def report_startup(terminalreporter):
+    if not terminalreporter.config.getoption("--startup-report") or "collection_ms" not in STARTUP_TIMINGS:
+        return
+    heavy = STARTUP_TIMINGS["heavy_modules"]
+    terminalreporter.write_sep("=", f"Startup (worker {worker_id()})")
+    terminalreporter.write_line(f"conftest import: {CONFTEST_IMPORT_MS:.1f} ms")
+    terminalreporter.write_line(f"collection: {STARTUP_TIMINGS['collection_ms']:.1f} ms "
+                                f"for {STARTUP_TIMINGS['items']} test(s)")
+    terminalreporter.write_line(f"heavy modules loaded by collection: {', '.join(heavy) or 'none'}",
+                                red=bool(heavy))
+    if PRELOADED_MODULES:
+        terminalreporter.write_line(f"already loaded by pytest plugins: {', '.join(PRELOADED_MODULES)}")
+
+# Session-level table of the slowest page-object methods
+def pytest_terminal_summary(terminalreporter):
+    report_startup(terminalreporter)
+    report_page_load_timings(terminalreporter)
+    report_page_metrics(terminalreporter)
+
+    profiler = driver_profiler.ACTIVE
+    if profiler is None or not profiler.session_methods:
+        return
+    table = profiler.session_table()
+    terminalreporter.write_sep("=", "WebDriver profile (all workers)")
+    terminalreporter.write_line(table)
+    logger.info("Slowest page-object methods:\n" + table)
+
 # Pytest hook to log test results and capture screenshots on failure
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -140,12 +517,62 @@ def pytest_runtest_makereport(item, call):
         if rep.failed and not hasattr(rep, "wasxfail"):
             capture_screenshot(item)  # Capture screenshot on failure (Helper Function)
 
+        report_driver_profile(item)  # Per-test WebDriver profile, --profile-driver only (Helper Function)
+
 
 # Fixture to provide PracticePage instance
 @pytest.fixture
 def practice_page(driver):
     return PracticePage(driver)
 
+# Batch mode: the first test of a dataset runs ALL its selected rows on the loaded page,
+# every row's test then only asserts its own stored result (see TestAutoSuggestionBatch).
+@pytest.fixture(scope="class")
+def autosuggestion_batch(request, driver):
+    flow = AutoSuggestionsFlow(PracticePage(driver))
+    results = {}   # data file path -> {row number: result}
+
+    def take_screenshot(result):
+        try:
+            return driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.warning(f"Failed to capture screenshot for batch row {result['row']}: {e}")
+            return None
+
+    # Every worker sees the full session.items; only grouped scheduling keeps a dataset on one worker
+    dist = getattr(request.config.option, "dist", "no")
+    if "PYTEST_XDIST_WORKER" in os.environ and dist not in ("loadgroup", "loadscope", "loadfile"):
+        logger.warning(f"Batch mode with --dist {dist}: use --dist loadgroup, otherwise every worker "
+                       f"runs the whole dataset")
+
+    def result_for(row):
+        source = row.source
+        if source.path not in results:
+            # Only the rows pytest actually selected (-k, shards, ...) for this dataset
+            numbers = sorted({
+                param.number
+                for item in request.session.items if hasattr(item, "callspec")
+                for param in item.callspec.params.values()
+                if isinstance(param, LazyRow) and param.source.path == source.path
+            })
+            rows = []
+            for number in numbers:
+                data = source.canonical_row(number)
+                rows.append((number, data["partial_name"], data["full_name"]))
+            batch = flow.select_countries_in_batch(rows, on_row_failure=take_screenshot)
+            results[source.path] = {result["row"]: result for result in batch}
+            failed = sum(not result["passed"] for result in batch)
+            logger.info(f"Batch {os.path.basename(source.path)}: {len(batch)} rows, {failed} failed")
+        return results[source.path][row.number]
+
+    return result_for
+
+@pytest.fixture
+def batch_result(request, autosuggestion_batch):
+    marker = request.node.get_closest_marker("data_source")
+    argname = marker.kwargs.get("argname") or marker.args[1]
+    return autosuggestion_batch(request.node.callspec.params[argname])
+
 
 
 #BASIC IMPLEMENTATION OF LOGGING TEST RESULTS
@@ -14,4 +14,37 @@ class AutoSuggestionsFlow:
         
         # Verify that the selected country is populated in the input field
         selected_country = self.practice_page.get_selected_country()
-        return selected_country
\ No newline at end of file
+        return selected_country
+
+    def select_countries_in_batch(self, rows, on_row_failure=None):
+        # Batch mode: many dataset rows back-to-back on ONE loaded page.
+        # rows: iterable of (row_number, partial_country_name, full_country_name)
+        # There is no page reload: between rows the suggestion menu is closed AND emptied
+        # (jQuery UI keeps the previous row's items hidden in the DOM) and the input is retyped.
+        # on_row_failure(result) is called right after a failing row, e.g. to take a screenshot.
+        results = []
+        for row_number, partial_country_name, full_country_name in rows:
+            try:
+                self.practice_page.close_autosuggestion_list()
+                self.practice_page.enter_partial_country_name(partial_country_name)
+                # Wait for suggestions of THIS row's text, then select from the visible items only
+                self.practice_page.wait_for_suggestions_matching(partial_country_name)
+                self.practice_page.select_country_from_list(full_country_name)
+                selected_country = self.practice_page.get_selected_country()
+                error = None
+            except Exception as e:
+                selected_country, error = None, f"{type(e).__name__}: {e}"
+
+            result = {
+                "row": row_number,
+                "partial_name": partial_country_name,
+                "expected": full_country_name,
+                "actual": selected_country,
+                "error": error,
+                "passed": error is None and selected_country == full_country_name,
+                "screenshot": None,
+            }
+            if not result["passed"] and on_row_failure:
+                result["screenshot"] = on_row_failure(result)
+            results.append(result)
+        return results
\ No newline at end of file
@@ -1,5 +1,22 @@
-from selenium.webdriver.common.by import By
+from base.by import By   # 🔧 UPDATED: same values as selenium By, no selenium.webdriver import
 from base.basepage import BasePage
+from base.smart_wait import LOCATE_JS
+from utils.page_reset import CLOSE_MENUS_JS
+
+# Batch mode helper (AutoSuggestionsFlow.select_countries_in_batch): rows must not see the
+# previous row's suggestions, so every menu is closed and emptied like a page reset does
+_CLOSE_SUGGESTIONS_JS = CLOSE_MENUS_JS + "return true;"
+
+# True once there is at least one visible suggestion and every visible one contains the typed text
+_SUGGESTIONS_MATCH_JS = LOCATE_JS + """
+var items = locateAll(arguments[0], arguments[1]), typed = arguments[2].toLowerCase(), visible = 0;
+for (var i = 0; i < items.length; i++) {
+    if (!isVisible(items[i])) { continue; }
+    visible++;
+    if (items[i].innerText.toLowerCase().indexOf(typed) === -1) { return false; }
+}
+return visible > 0;
+"""
 
 class PracticePage(BasePage):
     HIDE_BUTTON = (By.ID, "hide-textbox")
@@ -19,6 +36,9 @@ class PracticePage(BasePage):
     def is_textbox_displayed(self):
         return self.is_visible(self.TEXTBOX)
 
+    def is_textbox_hidden(self):
+        return self.is_hidden(self.TEXTBOX)
+
     def type_in_textbox(self, text):
         self.typeit(self.TEXTBOX, text)
 
@@ -38,11 +58,21 @@ class PracticePage(BasePage):
         self.typeit(self.COUNTRY_INPUT, partial_name)
         
     def wait_for_autosuggestion_list(self):
-        self.find_elements(self.SUGGESTIONS)
+        return self.find_elements(self.SUGGESTIONS)
+
+    def close_autosuggestion_list(self):
+        self.driver.execute_script(_CLOSE_SUGGESTIONS_JS)
+
+    def wait_for_suggestions_matching(self, partial_name):
+        # Visible suggestions for THIS text, never a previous lookup's list
+        return self._wait_until(
+            lambda driver: driver.execute_script(_SUGGESTIONS_MATCH_JS, *self.SUGGESTIONS, partial_name),
+            message=f"No visible autosuggestions for '{partial_name}'"
+        )
     
-    def select_country_from_list(self, country_name):
-        suggestions = self.driver.find_elements(*self.SUGGESTIONS)
-        self.pick_and_click_from_list(suggestions, country_name)
+    def select_country_from_list(self, country_name, match="exact"):
+        # 🔧 UPDATED: no re-query of SUGGESTIONS, match + click happens in the browser
+        return self.select_from_list(self.SUGGESTIONS, country_name, match=match)
     
     def get_selected_country(self):
         return self.get_value_of_element(self.COUNTRY_INPUT)
@@ -1,27 +1,161 @@
+import argparse
 import subprocess
 import sys
+import time
 from datetime import datetime
 import os
 
-os.makedirs("reports", exist_ok=True)
+from utils import sharding
 
-timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-report_path = f"reports/TestReport-{timestamp}.html"
 
-command = [
-    sys.executable,
-    "-m",
-    "pytest",
-    "tests",                      # 👈 IMPORTANT
-    "-v",
-    "--html", report_path,
-    "--self-contained-html"
-]
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the UI test suite with an HTML report")
+    parser.add_argument(
+        "--workers",
+        default=None,
+        help="Run tests in N parallel worker processes (a number or 'auto' for one per CPU core)"
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        help="Split the suite into N balanced shards run as concurrent pytest processes, then merge the reports"
+    )
+    parser.add_argument(
+        "--alluredir",
+        default="allure-results",
+        help="Where the (merged) Allure results are written"
+    )
+    # Anything else (e.g. --env=uat --headless -k autosuggestion) is passed straight to pytest
+    return parser.parse_known_args()
 
-subprocess.run(command)
-print(f"Test report generated at: {report_path}")
+
+def run_single(args, pytest_args, timestamp):
+    report_path = f"reports/TestReport-{timestamp}.html"
+
+    command = [
+        sys.executable,
+        "-m",
+        "pytest",
+        "tests",                      # 👈 IMPORTANT
+        "-v",
+        "--html", report_path,
+        "--self-contained-html",
+        "--alluredir", args.alluredir
+    ]
+
+    # Parallel mode: pytest-xdist starts N workers, each with its own browser pool.
+    # --dist loadgroup hands out single tests (not whole classes), so parametrized rows spread across
+    # workers, except @pytest.mark.xdist_group tests (batch mode) which stay together on one worker.
+    if args.workers:
+        command += ["-n", str(args.workers), "--dist", "loadgroup"]
+
+    command += pytest_args
+
+    result = subprocess.run(command)
+    print(f"Test report generated at: {report_path}")
+    return result.returncode
+
+
+def collect_test_ids(pytest_args):
+    # Same selection the shards will run (-k, -m, ... are honoured)
+    # Returns (test ids, pytest exit code); exit code 5 = nothing collected
+    command = [sys.executable, "-m", "pytest", "tests", "--collect-only", "-q"] + pytest_args
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode not in (0, 5):
+        # Collection errors, usage errors, ... -> show pytest's own output
+        print(result.stdout)
+        print(result.stderr, file=sys.stderr)
+    return [line.strip() for line in result.stdout.splitlines() if "::" in line], result.returncode
+
+
+def run_sharded(args, pytest_args, timestamp):
+    test_ids, exit_code = collect_test_ids(pytest_args)
+    if exit_code != 0:
+        print(f"Collection failed with exit code {exit_code}, no shards started")
+        return exit_code
+    if not test_ids:
+        print("No tests collected, nothing to shard")
+        return 5
+
+    durations = sharding.load_durations()
+    shards = sharding.partition(test_ids, args.shards, durations)
+    shard_root = os.path.join("reports", "shards", timestamp)
+
+    # 1. Start every shard as its own pytest process
+    started = time.perf_counter()
+    running = []
+    for index, shard in enumerate(shards):
+        shard_dir = os.path.join(shard_root, f"shard-{index}")
+        os.makedirs(shard_dir, exist_ok=True)
+
+        # Research note: pytest reads arguments from a file when given @path,
+        # which avoids command-line length limits with thousands of test ids.
+        ids_file = os.path.join(shard_dir, "test_ids.txt")
+        with open(ids_file, "w") as file:
+            file.write("\n".join(shard["ids"]))
+
+        info = {
+            "index": index,
+            "html": os.path.join(shard_dir, "report.html"),
+            "junit": os.path.join(shard_dir, "junit.xml"),
+            "allure": os.path.join(shard_dir, "allure-results"),
+            "durations": os.path.join(shard_dir, "durations.json"),
+        }
+        command = [
+            sys.executable, "-m", "pytest", f"@{ids_file}",
+            "-v",
+            "--html", info["html"], "--self-contained-html",
+            "--junitxml", info["junit"],
+            "--alluredir", info["allure"],
+            "--record-durations", info["durations"],
+        ] + pytest_args
+        log = open(os.path.join(shard_dir, "output.log"), "w")
+        info["log"] = log
+        info["process"] = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        running.append(info)
+        print(f"Shard {index}: {len(shard['ids'])} tests (estimated {shard['weight']:.1f}s)")
+
+    # 2. Wait for all of them
+    for info in running:
+        info["exit_code"] = info["process"].wait()
+        info["log"].close()
+        print(f"Shard {info['index']} finished with exit code {info['exit_code']}")
+    wall_time = time.perf_counter() - started
+
+    # 3. Merge durations, Allure results and the HTML report
+    sharding.merge_durations([info["durations"] for info in running])
+    copied = sharding.merge_allure_results([info["allure"] for info in running], args.alluredir)
+    report_path = f"reports/TestReport-{timestamp}.html"
+    totals = sharding.write_merged_html(report_path, running, wall_time)
+
+    print(f"Merged {copied} Allure result files into {args.alluredir}")
+    print(f"Results: {totals}")
+    print(f"Test report generated at: {report_path}")
+    return sharding.combine_exit_codes([info["exit_code"] for info in running])
+
+
+def main():
+    args, pytest_args = parse_args()
+
+    os.makedirs("reports", exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    if args.shards and args.shards > 1:
+        return run_sharded(args, pytest_args, timestamp)
+    return run_single(args, pytest_args, timestamp)
+
+
+# Research note: pytest also collects *_test.py files, so without this guard
+# collecting the project would import this file and start a second test run.
+if __name__ == "__main__":
+    sys.exit(main())
 
 
 # Run for CI/CD pipelines without HTML report
 # python -m pytest tests -v --html=reports/TestReport.html --self-contained-html --alluredir=allure-results
-# allure generate allure-results -o allure-report --clean
\ No newline at end of file
+# allure generate allure-results -o allure-report --clean
+# Parallel run (4 workers, 1 warm browser each)
+# python run_test.py --workers 4 --headless --env=uat
+# Sharded run (4 concurrent pytest processes, one merged report + allure-results)
+# python run_test.py --shards 4 --headless --env=uat
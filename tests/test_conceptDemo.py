@@ -1,12 +1,8 @@
 import pytest
 from flows.alert_flow import AlertFlow
 from flows.autosuggestions_flow import AutoSuggestionsFlow
-from pages.practice_page import PracticePage
 from utils.logger import get_logger
-import utils.datareader
 
-datajson = utils.datareader.load_testdata("./data/autosuggestion_entries.json")
-datacsv = utils.datareader.load_csvtestdata("./data/autosuggestion_entries.csv")
 logger = get_logger()
 
 class TestConcept:
@@ -27,7 +23,7 @@ class TestConcept:
         assert practice_page.get_textbox_value() == "Haryish", "Typed value should be appeared"
 
         practice_page.click_hide_button()
-        assert not practice_page.is_textbox_displayed(), "Textbox should be hidden after clicking hide"
+        assert practice_page.is_textbox_hidden(), "Textbox should be hidden after clicking hide"
 
     @pytest.mark.skip(reason="Demonstration of pytest skip functionality")
     def test_check_alert_message_content(self, practice_page):
@@ -62,7 +58,8 @@ class TestConcept:
         selected_country = autosuggestion_flow.select_country_from_autosuggestions(partial_country_name, full_country_name)
         assert selected_country == full_country_name, "Selected country should be populated correctly in the input field"
 
-    @pytest.mark.parametrize("dataset", datajson)
+    @pytest.mark.row_mode("per_row")
+    @pytest.mark.data_source("data/autosuggestion_entries.json", argname="dataset", schema="autosuggestion")
     def test_autosuggestion_dropdown_method2(self, practice_page, dataset):
         # This is method 2 of data driven testing using external json file
         # Verify that user can type a partial country name, select a value from the auto-suggestion list, and the selected value is populated correctly.
@@ -70,10 +67,30 @@ class TestConcept:
         selected_country = autosuggestion_flow.select_country_from_autosuggestions(dataset["partial_name"], dataset["full_name"])
         assert selected_country == dataset["full_name"], "Selected country should be populated correctly in the input field"
 
-    @pytest.mark.parametrize("datacsv", datacsv)
+    @pytest.mark.row_mode("per_row")
+    @pytest.mark.data_source("data/autosuggestion_entries.csv", argname="datacsv", schema="autosuggestion")
     def test_autosuggestion_dropdown_method3(self, practice_page, datacsv):
         # This is method 3 of data driven testing using fixture to read external csv file
         # Verify that user can type a partial country name, select a value from the auto-suggestion list, and the selected value is populated correctly.
         autosuggestion_flow = AutoSuggestionsFlow(practice_page)
         selected_country = autosuggestion_flow.select_country_from_autosuggestions(datacsv["partial_name"], datacsv["full_country_name"])
-        assert selected_country == datacsv["full_country_name"], "Selected country should be populated correctly in the input field"
\ No newline at end of file
+        assert selected_country == datacsv["full_country_name"], "Selected country should be populated correctly in the input field"
+
+
+# Method 4: batch mode, opt-in with --row-mode=batch (replaces method 2 and 3).
+# All rows of a dataset run back-to-back on ONE loaded page (no reload, no per-row page object);
+# the first test triggers the batch and each row is still its own test.
+# xdist_group keeps the class on one worker with --dist loadgroup (what run_test.py --workers uses).
+@pytest.mark.row_mode("batch")
+@pytest.mark.xdist_group("autosuggestion_batch")
+@pytest.mark.page_reset("none")
+class TestAutoSuggestionBatch:
+    @pytest.mark.data_source("data/autosuggestion_entries.json", argname="dataset", schema="autosuggestion")
+    def test_autosuggestion_batch_json(self, batch_result, dataset):
+        assert batch_result["error"] is None, batch_result["error"]
+        assert batch_result["actual"] == batch_result["expected"], "Selected country should be populated correctly in the input field"
+
+    @pytest.mark.data_source("data/autosuggestion_entries.csv", argname="datacsv", schema="autosuggestion")
+    def test_autosuggestion_batch_csv(self, batch_result, datacsv):
+        assert batch_result["error"] is None, batch_result["error"]
+        assert batch_result["actual"] == batch_result["expected"], "Selected country should be populated correctly in the input field"
\ No newline at end of file
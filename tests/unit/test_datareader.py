@@ -0,0 +1,94 @@
+import json
+import os
+
+import pytest
+
+from utils.datareader import DataSource, parse_shard
+
+# Unit tests for the lazy data provider (no browser needed)
+
+
+def write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    return write(tmp_path / "rows.csv", "partial_name,full_country_name\nind,India\naus,Australia\nger,Germany\n")
+
+
+def test_csv_rows_are_read_by_offset(csv_file):
+    source = DataSource(csv_file, schema="autosuggestion")
+    assert len(source) == 3
+    assert source.row(1) == {"partial_name": "aus", "full_country_name": "Australia"}
+    assert list(source)[2]["full_country_name"] == "Germany"
+
+
+def test_canonical_row_resolves_schema_aliases(csv_file, tmp_path):
+    json_file = write(tmp_path / "rows.json", json.dumps([{"partial_name": "ind", "full_name": "India"}]))
+    assert DataSource(csv_file, schema="autosuggestion").canonical_row(0) == {"partial_name": "ind", "full_name": "India"}
+    assert DataSource(json_file, schema="autosuggestion").canonical_row(0) == {"partial_name": "ind", "full_name": "India"}
+
+
+def test_jsonl_skips_blank_lines(tmp_path):
+    path = write(tmp_path / "rows.jsonl", '{"partial_name": "ind", "full_name": "India"}\n\n'
+                                          '{"partial_name": "aus", "full_name": "Australia"}\n')
+    source = DataSource(path, schema="autosuggestion")
+    assert len(source) == 2
+    assert source.row(1)["full_name"] == "Australia"
+
+
+def test_index_is_rebuilt_when_the_file_changes(csv_file):
+    source = DataSource(csv_file)
+    assert len(source) == 3
+    with open(csv_file, "a", encoding="utf-8") as file:
+        file.write("bra,Brazil\n")
+    assert len(source) == 4
+    assert source.row(3)["full_country_name"] == "Brazil"
+
+
+def test_missing_schema_field_is_reported(tmp_path):
+    path = write(tmp_path / "rows.csv", "partial_name,country\nind,India\n")
+    with pytest.raises(ValueError, match="full_name"):
+        DataSource(path, schema="autosuggestion")
+
+
+def test_unsupported_file_type(tmp_path):
+    with pytest.raises(ValueError, match="unsupported data file type"):
+        DataSource(write(tmp_path / "rows.txt", "ind,India\n"))
+
+
+def test_shard_indices_split_rows_round_robin(csv_file):
+    source = DataSource(csv_file)
+    assert list(source.shard_indices("0/2")) == [0, 2]
+    assert list(source.shard_indices("1/2")) == [1]
+    assert list(source.shard_indices()) == [0, 1, 2]
+
+
+def test_shard_indices_from_environment(csv_file, monkeypatch):
+    monkeypatch.setenv("AUT_DATA_SHARD", "2/3")
+    assert list(DataSource(csv_file).shard_indices()) == [2]
+
+
+@pytest.mark.parametrize("spec", ["3/3", "-1/2", "0/0"])
+def test_parse_shard_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        parse_shard(spec)
+
+
+def test_lazy_rows_are_parsed_on_first_access(csv_file):
+    rows = DataSource(csv_file).lazy_rows()
+    assert [row.number for row in rows] == [0, 1, 2]
+    assert rows[1]._row is None
+    assert rows[1]["partial_name"] == "aus"
+    assert rows[1]._row is not None
+    assert os.path.isabs(rows[1].source.path)
+
+
+def test_csv_quoted_field_may_span_lines(tmp_path):
+    path = write(tmp_path / "rows.csv", 'partial_name,full_country_name\nind,"India\nRepublic"\naus,Australia\n')
+    source = DataSource(path, schema="autosuggestion")
+    assert len(source) == 2
+    assert source.row(0)["full_country_name"] == "India\nRepublic"
+    assert source.row(1)["full_country_name"] == "Australia"
@@ -0,0 +1,30 @@
+import json
+import logging
+import queue
+import sys
+
+from utils.logger import JsonLinesFormatter, _LazyQueueHandler
+
+# Unit tests for the JSON lines log format (no listener thread, no log file)
+
+
+def queued_line(exc_info=None):
+    record = logging.LogRecord("automation", logging.ERROR, __file__, 1, "boom %s", (1,), exc_info)
+    prepared = _LazyQueueHandler(queue.SimpleQueue()).prepare(record)
+    return json.loads(JsonLinesFormatter().format(prepared))
+
+
+def test_traceback_is_kept_out_of_the_message():
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        entry = queued_line(sys.exc_info())
+    assert entry["message"] == "boom 1"
+    assert entry["exc_info"].startswith("Traceback")
+    assert "ZeroDivisionError" in entry["exc_info"]
+
+
+def test_no_exc_info_field_without_an_exception():
+    entry = queued_line()
+    assert entry["message"] == "boom 1"
+    assert "exc_info" not in entry
@@ -0,0 +1,54 @@
+import pytest
+
+from utils.page_reset import PageResetEngine
+
+# Unit tests for the in-page reset engine, with a fake driver (no browser needed)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.scripts = []
+        self.refreshes = 0
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if args:
+            return True    # restore succeeded
+        return {"url": "http://aut/", "controls": [], "styled": []}
+
+    def refresh(self):
+        self.refreshes += 1
+
+
+@pytest.fixture
+def engine():
+    engine = PageResetEngine(FakeDriver())
+    engine.snapshot()
+    return engine
+
+
+def restores(engine):
+    return len(engine.driver.scripts) - 1   # minus the snapshot
+
+
+def test_first_soft_reset_after_snapshot_skips_the_restore(engine):
+    assert engine.reset("soft") == "soft"
+    assert restores(engine) == 0
+    assert engine.reset("soft") == "soft"
+    assert restores(engine) == 1
+
+
+def test_none_leaves_the_page_dirty_for_the_next_reset(engine):
+    assert engine.reset("none") == "none"
+    assert engine.reset("soft") == "soft"
+    assert restores(engine) == 1
+
+
+def test_reload_strategy_refreshes(engine):
+    assert engine.reset("reload") == "reload"
+    assert engine.driver.refreshes == 1
+
+
+def test_unknown_strategy(engine):
+    with pytest.raises(ValueError, match="Unknown page reset strategy"):
+        engine.reset("hard")
@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+
+from utils.screenshots import ScreenshotWriter
+
+# Unit tests for the background screenshot writer (no browser needed)
+
+PNG_A = b"\x89PNG\r\n\x1a\n" + b"a" * 100
+PNG_B = b"\x89PNG\r\n\x1a\n" + b"b" * 100
+
+
+def pngs(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".png"))
+
+
+def make_old_png(directory, name, age_seconds, size=10):
+    path = os.path.join(directory, name)
+    with open(path, "wb") as file:
+        file.write(b"x" * size)
+    stamp = time.time() - age_seconds
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def test_identical_screenshots_are_stored_once(tmp_path):
+    writer = ScreenshotWriter(directory=str(tmp_path))
+    writer.submit("test_one", PNG_A)
+    writer.submit("test_two", PNG_A)
+    writer.submit("test_three", PNG_B)
+    writer.close()
+    assert len(pngs(tmp_path)) == 2
+
+
+def test_dedupe_recognises_files_from_earlier_runs(tmp_path):
+    first = ScreenshotWriter(directory=str(tmp_path))
+    first.submit("test_one", PNG_A)
+    first.close()
+    second = ScreenshotWriter(directory=str(tmp_path))
+    second.submit("test_two", PNG_A)
+    second.close()
+    assert len(pngs(tmp_path)) == 1
+
+
+def test_dedupe_can_be_switched_off(tmp_path):
+    writer = ScreenshotWriter(directory=str(tmp_path), dedupe=False)
+    writer.submit("test_one", PNG_A)
+    writer.submit("test_two", PNG_A)
+    writer.close()
+    assert len(pngs(tmp_path)) == 2
+
+
+def test_file_name_carries_test_name_and_content_hash(tmp_path):
+    writer = ScreenshotWriter(directory=str(tmp_path))
+    writer.submit("test_login", PNG_A)
+    writer.close()
+    (name,) = pngs(tmp_path)
+    assert name.startswith("test_login_")
+    assert len(name.rsplit("_", 1)[1]) == len("0123456789ab.png")
+
+
+def test_retention_keeps_the_newest_files(tmp_path):
+    for index in range(5):
+        make_old_png(str(tmp_path), f"old{index}.png", age_seconds=100 - index)
+    ScreenshotWriter(directory=str(tmp_path), max_files=3).close()
+    assert pngs(tmp_path) == ["old2.png", "old3.png", "old4.png"]
+
+
+def test_retention_by_total_size(tmp_path):
+    for index in range(4):
+        make_old_png(str(tmp_path), f"old{index}.png", age_seconds=100 - index, size=10)
+    ScreenshotWriter(directory=str(tmp_path), max_bytes=25).close()
+    assert pngs(tmp_path) == ["old2.png", "old3.png"]
+
+
+def test_retention_by_age(tmp_path):
+    make_old_png(str(tmp_path), "stale.png", age_seconds=3 * 86400)
+    make_old_png(str(tmp_path), "fresh.png", age_seconds=60)
+    ScreenshotWriter(directory=str(tmp_path), max_age_days=1).close()
+    assert pngs(tmp_path) == ["fresh.png"]
+
+
+def test_recompress_without_pillow_keeps_the_original(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "PIL", None)   # makes "from PIL import Image" raise ImportError
+    writer = ScreenshotWriter(directory=str(tmp_path), recompress=True)
+    writer.submit("test_one", PNG_A)
+    writer.close()
+    (name,) = pngs(tmp_path)
+    assert (tmp_path / name).read_bytes() == PNG_A
+    assert writer.recompress is False
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from utils import sharding
+
+# Unit tests for run_test.py --shards helpers (no browser needed)
+
+
+def test_partition_balances_by_duration():
+    ids = ["a", "b", "c", "d", "e"]
+    durations = {"a": 10, "b": 6, "c": 5, "d": 4, "e": 1}
+    shards = sharding.partition(ids, 2, durations)
+
+    assert sorted(test_id for shard in shards for test_id in shard["ids"]) == ids
+    # Longest first, each to the lightest shard: a | b, c | +d -> a, d | +e -> b, c, e
+    assert sorted(shard["weight"] for shard in shards) == [12, 14]
+
+
+def test_partition_keeps_collection_order_inside_a_shard():
+    ids = ["t1", "t2", "t3", "t4"]
+    shards = sharding.partition(ids, 2, {"t4": 5, "t1": 1, "t2": 1, "t3": 1})
+    for shard in shards:
+        assert shard["ids"] == sorted(shard["ids"], key=ids.index)
+
+
+def test_partition_weighs_unknown_tests_as_the_median():
+    shards = sharding.partition(["known1", "known2", "known3", "new"], 2, {"known1": 1, "known2": 3, "known3": 9})
+    assert sum(shard["weight"] for shard in shards) == 1 + 3 + 9 + 3
+
+
+def test_partition_without_history_splits_by_count():
+    shards = sharding.partition([f"t{i}" for i in range(7)], 3)
+    assert sorted(len(shard["ids"]) for shard in shards) == [2, 2, 3]
+
+
+def test_partition_drops_empty_shards():
+    assert len(sharding.partition(["only"], 4)) == 1
+
+
+@pytest.mark.parametrize("codes, expected", [
+    ([0, 0], 0),
+    ([0, 1], 1),
+    ([5, 0], 0),
+    ([5, 5], 5),
+    ([1, 2], 2),
+    ([0, 4, 1], 4),
+    ([], 0),
+])
+def test_combine_exit_codes(codes, expected):
+    assert sharding.combine_exit_codes(codes) == expected
+
+
+def test_merge_durations_updates_the_history(tmp_path):
+    history = tmp_path / "reports" / "durations.json"
+    history.parent.mkdir()
+    history.write_text(json.dumps({"old": 1.0, "a": 9.0}))
+    shard = tmp_path / "shard.json"
+    shard.write_text(json.dumps({"a": 2.0, "b": 3.0}))
+
+    merged = sharding.merge_durations([str(shard), str(tmp_path / "missing.json")], path=str(history))
+    assert merged == {"old": 1.0, "a": 2.0, "b": 3.0}
+    assert json.loads(history.read_text()) == merged
+
+
+def test_merge_allure_results_copies_every_file(tmp_path):
+    for index in range(2):
+        shard_dir = tmp_path / f"shard-{index}"
+        shard_dir.mkdir()
+        (shard_dir / f"{index}-result.json").write_text("{}")
+    copied = sharding.merge_allure_results([str(tmp_path / "shard-0"), str(tmp_path / "shard-1")],
+                                           str(tmp_path / "merged"))
+    assert copied == 2
+    assert sorted(path.name for path in (tmp_path / "merged").iterdir()) == ["0-result.json", "1-result.json"]
+
+
+def test_write_merged_html_counts_junit_outcomes(tmp_path):
+    junit = tmp_path / "junit.xml"
+    junit.write_text(
+        "<testsuites><testsuite>"
+        "<testcase classname='tests.T' name='ok' time='1.5'/>"
+        "<testcase classname='tests.T' name='bad' time='0.5'><failure message='boom'/></testcase>"
+        "<testcase classname='tests.T' name='skip' time='0'><skipped message='later'/></testcase>"
+        "</testsuite></testsuites>"
+    )
+    report = tmp_path / "report.html"
+    shards = [{"index": 0, "junit": str(junit), "html": str(tmp_path / "shard-0.html"), "exit_code": 1}]
+
+    totals = sharding.write_merged_html(str(report), shards, wall_time=2.0)
+    assert totals == {"passed": 1, "failed": 1, "error": 0, "skipped": 1}
+    assert "boom" in report.read_text()
@@ -0,0 +1,45 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from base.smart_wait import SmartWait
+
+# Unit tests for SmartWait's polling fallback, with a fake driver (no browser needed)
+
+
+class FakeDriver:
+    def __init__(self, configured_implicit_wait=10):
+        self.configured_implicit_wait = configured_implicit_wait
+        self.implicit_waits = []
+
+    def implicitly_wait(self, seconds):
+        self.implicit_waits.append(seconds)
+
+
+def test_implicit_wait_is_off_while_polling_and_restored():
+    driver = FakeDriver()
+    seen = []
+
+    def condition(d):
+        seen.append(d.implicit_waits[-1])
+        return len(seen) == 2
+
+    assert SmartWait(driver, timeout=1, poll_start=0.001).until(condition)
+    assert seen == [0, 0]
+    assert driver.implicit_waits == [0, 10]
+
+
+def test_implicit_wait_is_restored_after_a_timeout():
+    driver = FakeDriver()
+
+    def missing(d):
+        raise NoSuchElementException()
+
+    with pytest.raises(TimeoutException):
+        SmartWait(driver, timeout=0.01, poll_start=0.001).until(missing)
+    assert driver.implicit_waits == [0, 10]
+
+
+def test_no_extra_commands_without_an_implicit_wait():
+    driver = FakeDriver(configured_implicit_wait=0)
+    assert SmartWait(driver, timeout=1).until(lambda d: True)
+    assert driver.implicit_waits == []
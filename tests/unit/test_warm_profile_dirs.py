@@ -0,0 +1,30 @@
+import os
+import socket
+import sys
+
+import pytest
+
+from utils import driver_factory
+
+# Unit tests for claiming warm Chrome profile dirs (no browser needed)
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="SingletonLock is a symlink on POSIX only")
+
+
+def singleton_lock(path, pid):
+    os.makedirs(path, exist_ok=True)
+    os.symlink(f"{socket.gethostname()}-{pid}", os.path.join(path, "SingletonLock"))
+
+
+def test_dir_without_lock_is_free(tmp_path):
+    assert not driver_factory._chrome_still_running(str(tmp_path))
+
+
+def test_lock_of_a_live_chrome_keeps_the_dir_busy(tmp_path):
+    singleton_lock(str(tmp_path), os.getpid())
+    assert driver_factory._chrome_still_running(str(tmp_path))
+
+
+def test_lock_left_behind_by_a_dead_chrome_is_ignored(tmp_path):
+    singleton_lock(str(tmp_path), 2 ** 22 + 1)   # above the default pid_max
+    assert not driver_factory._chrome_still_running(str(tmp_path))
@@ -0,0 +1,314 @@
+import argparse
+import contextlib
+import dataclasses
+import itertools
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from utils.browser_pool import BrowserPool
+from utils.driver_cache import CACHE_DIR, resolve_chromedriver, write_json_atomic
+from utils.driver_factory import apply_timeouts, build_options, prepare_new_browser
+from utils.logger import worker_id
+
+# Intention: Keep warm Chrome sessions alive BETWEEN pytest runs (opt-in with --reuse-browser).
+# A standalone chromedriver runs detached from pytest ("the daemon"). Every browser slot of a
+# worker (main-0, gw0-0, ...) remembers its session id in a small state file, and the next run
+# reattaches to that session instead of launching Chrome again.
+# - Attach  -> health check (one execute_script) and launch settings must match, otherwise the
+#              session is recycled: quit and replaced by a new one
+# - quit()  -> only detaches; the browser keeps running for the next run
+# - A session handed back on a restored page is "clean": the next run skips the initial load
+#
+#   python -m utils.browser_daemon start|stop|status
+#
+# Research note: chromedriver never expires idle sessions, so a reattached session is exactly as
+# the last run left it. That is why only a clean page skips the load; anything else reloads.
+
+DAEMON_DIR = os.path.join(CACHE_DIR, "browser-daemon")
+DAEMON_FILE = os.path.join(DAEMON_DIR, "daemon.json")
+SESSIONS_DIR = os.path.join(DAEMON_DIR, "sessions")
+LOCK_FILE = os.path.join(DAEMON_DIR, "start.lock")
+LOG_FILE = os.path.join(DAEMON_DIR, "chromedriver.log")
+
+START_TIMEOUT = 15
+
+# Browser slots of this process, numbered like the browser pool launches them
+_slots = itertools.count()
+
+
+class DaemonChrome(webdriver.Remote):
+    # Remote driver for the daemon's chromedriver that can also attach to an existing session
+    def __init__(self, url, slot, options=None, session_id=None):
+        self.slot = slot
+        self.fingerprint = None
+        self.reuse_url = None       # {"requested", "reached"} of the clean page it was handed back on
+        self.requested_url = None   # base_url the driver fixture asked for (before redirects)
+        self._attach_to = session_id
+        executor = ChromiumRemoteConnection(url, vendor_prefix="goog", browser_name="chrome")
+        super().__init__(command_executor=executor, options=options or webdriver.ChromeOptions())
+
+    def start_session(self, capabilities):
+        if self._attach_to:
+            self.session_id = self._attach_to
+            self.caps = {}
+            return
+        super().start_session(capabilities)
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        # webdriver.Chrome has this built in, Remote does not
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        # Detach only: save the session for the next run and keep the browser alive
+        write_json_atomic(_session_file(self.slot), {
+            "session_id": self.session_id,
+            "fingerprint": self.fingerprint,
+            "reuse_url": self.reuse_url,
+        })
+        self.command_executor.close()
+
+    def shutdown(self):
+        # Really end the browser session
+        super().quit()
+
+
+# ---------- state files ----------
+
+def _read_json(path):
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _session_file(slot):
+    return os.path.join(SESSIONS_DIR, f"{slot}.json")
+
+
+@contextlib.contextmanager
+def _start_lock(timeout=START_TIMEOUT):
+    # Several xdist workers may want to start the daemon at the same moment
+    os.makedirs(DAEMON_DIR, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            # A lock older than the timeout belongs to a process that died while starting
+            try:
+                if time.time() - os.path.getmtime(LOCK_FILE) > timeout:
+                    os.remove(LOCK_FILE)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {LOCK_FILE}")
+            time.sleep(0.1)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        with contextlib.suppress(OSError):
+            os.remove(LOCK_FILE)
+
+
+# ---------- daemon (standalone chromedriver) ----------
+
+def _url(state):
+    return f"http://127.0.0.1:{state['port']}"
+
+
+def _is_ready(state):
+    try:
+        with urllib.request.urlopen(f"{_url(state)}/status", timeout=1) as response:
+            return bool(json.load(response)["value"]["ready"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def daemon_state():
+    # {"pid", "port", "chromedriver"} of a running daemon, or None
+    state = _read_json(DAEMON_FILE)
+    if state and _is_ready(state):
+        return state
+    return None
+
+
+def start():
+    with _start_lock():
+        state = daemon_state()
+        if state:
+            return state
+
+        # Sessions of a dead daemon died with it
+        for name in os.listdir(SESSIONS_DIR) if os.path.isdir(SESSIONS_DIR) else []:
+            with contextlib.suppress(OSError):
+                os.remove(os.path.join(SESSIONS_DIR, name))
+
+        path = resolve_chromedriver()
+        port = _free_port()
+        detach = {"start_new_session": True}
+        if sys.platform.startswith("win"):
+            detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        with open(LOG_FILE, "a") as log:
+            process = subprocess.Popen(
+                [path, f"--port={port}"],
+                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, **detach
+            )
+        state = {"pid": process.pid, "port": port, "chromedriver": path}
+
+        deadline = time.monotonic() + START_TIMEOUT
+        while not _is_ready(state):
+            if process.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError(f"chromedriver daemon did not start, see {LOG_FILE}")
+            time.sleep(0.1)
+        write_json_atomic(DAEMON_FILE, state)
+        return state
+
+
+def stop():
+    # Quit every saved session, then the chromedriver itself. Returns the number of sessions quit.
+    state = _read_json(DAEMON_FILE)
+    closed = 0
+    if state and _is_ready(state):
+        for slot, saved in _saved_sessions():
+            with contextlib.suppress(Exception):
+                DaemonChrome(_url(state), slot, session_id=saved["session_id"]).shutdown()
+                closed += 1
+        with contextlib.suppress(OSError):
+            urllib.request.urlopen(f"{_url(state)}/shutdown", timeout=2).close()
+    elif state:
+        # Not answering any more: make sure the process is really gone
+        with contextlib.suppress(OSError):
+            os.kill(state["pid"], signal.SIGTERM)
+    for path in [DAEMON_FILE] + [_session_file(slot) for slot, _ in _saved_sessions()]:
+        with contextlib.suppress(OSError):
+            os.remove(path)
+    return closed
+
+
+def _saved_sessions():
+    if not os.path.isdir(SESSIONS_DIR):
+        return []
+    sessions = []
+    for name in sorted(os.listdir(SESSIONS_DIR)):
+        if name.endswith(".json"):
+            saved = _read_json(os.path.join(SESSIONS_DIR, name))
+            if saved and saved.get("session_id"):
+                sessions.append((name[:-len(".json")], saved))
+    return sessions
+
+
+# ---------- sessions ----------
+
+def _fingerprint(headless, profile):
+    # Launch settings a reattached session must have been started with
+    return {"headless": bool(headless), "profile": dataclasses.asdict(profile) if profile else None}
+
+
+def attach_or_launch(config, headless=False, profile=None, logger=None):
+    # Browser factory for --reuse-browser: reattach this slot's saved session or start a new one
+    slot = f"{worker_id()}-{next(_slots)}"
+    url = _url(start())
+    fingerprint = _fingerprint(headless, profile)
+
+    saved = _read_json(_session_file(slot))
+    if saved and saved.get("session_id"):
+        driver = DaemonChrome(url, slot, session_id=saved["session_id"])
+        if saved.get("fingerprint") == fingerprint and BrowserPool.is_healthy(driver):
+            driver.fingerprint = fingerprint
+            driver.reuse_url = saved.get("reuse_url")
+            apply_timeouts(driver, config)
+            # Not clean any more until it is handed back on a restored page
+            write_json_atomic(_session_file(slot), dict(saved, reuse_url=None))
+            if logger:
+                logger.info(f"Reattached browser session {driver.session_id} (slot {slot})")
+            return driver
+        if logger:
+            logger.info(f"Recycling stale browser session {saved['session_id']} (slot {slot})")
+        with contextlib.suppress(Exception):
+            driver.shutdown()
+
+    driver = DaemonChrome(url, slot, options=build_options(headless=headless, profile=profile))
+    driver.fingerprint = fingerprint
+    prepare_new_browser(driver, config, profile)
+    write_json_atomic(_session_file(slot), {"session_id": driver.session_id, "fingerprint": fingerprint,
+                                      "reuse_url": None})
+    if logger:
+        logger.info(f"Started browser session {driver.session_id} in the daemon (slot {slot})")
+    return driver
+
+
+# Research note: the configured base_url is rarely the URL the browser ends up on
+# (http -> https redirect, added trailing slash), so both are kept: the requested URL
+# identifies the page, the reached URL is what current_url must still be.
+
+def is_warm(driver, base_url):
+    # True once per hand-back: the session was returned on a restored page of base_url and is still there
+    reuse_url, driver.reuse_url = getattr(driver, "reuse_url", None), None
+    if not isinstance(reuse_url, dict) or reuse_url.get("requested") != base_url:
+        return False
+    try:
+        warm = driver.current_url == reuse_url.get("reached")
+    except Exception:
+        return False
+    if warm:
+        driver.requested_url = base_url
+    return warm
+
+
+def mark_loaded(driver, base_url):
+    # Called right after driver.get(base_url)
+    driver.requested_url = base_url
+
+
+def mark_clean(driver):
+    # Called after the page was restored to its snapshot: the next user can skip the initial load
+    if isinstance(driver, DaemonChrome) and driver.requested_url:
+        driver.reuse_url = {"requested": driver.requested_url, "reached": driver.current_url}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent chromedriver for pytest --reuse-browser")
+    parser.add_argument("command", choices=("start", "stop", "status"))
+    args = parser.parse_args()
+
+    if args.command == "start":
+        state = start()
+        print(f"Browser daemon running: chromedriver pid {state['pid']} on port {state['port']}")
+    elif args.command == "stop":
+        closed = stop()
+        print(f"Browser daemon stopped ({closed} browser session(s) quit)")
+    else:
+        state = daemon_state()
+        if not state:
+            print("Browser daemon is not running")
+            return 1
+        print(f"Browser daemon running: chromedriver pid {state['pid']} on port {state['port']}")
+        for slot, saved in _saved_sessions():
+            driver = DaemonChrome(_url(state), slot, session_id=saved["session_id"])
+            health = "healthy" if BrowserPool.is_healthy(driver) else "stale"
+            driver.command_executor.close()
+            print(f"  {slot:<10} {saved['session_id']}  {health}  clean page: {(saved.get('reuse_url') or {}).get('reached') or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import queue
+import threading
+
+# Seconds lease() waits for a browser to come back before giving up (None = forever).
+# A lease that is never released would otherwise hang the whole worker.
+LEASE_TIMEOUT = 300
+
+
+# Intention: Keep a small set of warm browsers per worker process.
+# Tests lease a browser, use it and hand it back, instead of sharing one global driver.
+# Research note: With pytest-xdist every worker is its own process, so each worker
+# owns its own pool. Nothing here is shared between processes.
+# Test classes in one worker run one after another, so the pytest fixtures use size=1:
+# one warm browser per worker, replaced when it breaks. size > 1 only helps callers
+# that lease from several threads at once.
+class BrowserPool:
+    def __init__(self, factory, size=1):
+        self.factory = factory          # callable that returns a new WebDriver
+        self.size = max(1, int(size))
+        self._idle = queue.LifoQueue()  # LIFO -> most recently used (warmest) browser first
+        self._all = []
+        self._lock = threading.Lock()
+
+    def lease(self, timeout=LEASE_TIMEOUT):
+        # 1. Reuse an idle browser if there is one
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        # 2. Otherwise launch a new one while the pool is not full
+        with self._lock:
+            if len(self._all) < self.size:
+                driver = self.factory()
+                self._all.append(driver)
+                return driver
+
+        # 3. Pool is full -> wait for another test to give one back
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No browser was released within {timeout} s: all {self.size} browser(s) of this pool "
+                f"are still leased (a lease that is never released blocks the pool)"
+            ) from None
+
+    @staticmethod
+    def is_healthy(driver):
+        # One cheap round-trip: fails when the browser crashed or the session is gone
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def release(self, driver, healthy=True):
+        if healthy:
+            self._idle.put(driver)
+            return
+        # A broken browser is thrown away so the next lease launches a fresh one
+        self.discard(driver)
+
+    def discard(self, driver):
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        # Quit every browser this pool ever launched, leased or idle
+        with self._lock:
+            drivers, self._all = self._all, []
+        errors = []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                errors.append(e)
+        return len(drivers), errors
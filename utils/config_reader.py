@@ -1,26 +1,137 @@
-import os
 import configparser
+import functools
+import os
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+# Intention: Parse config.ini ONCE per process into a frozen, typed snapshot per environment.
+# Resolution order for every key:
+#   1. Environment variable AUT_<KEY>      e.g. AUT_BASE_URL, AUT_EXPLICIT_WAIT
+#   2. [<env>] section of config.ini       e.g. [uat]
+#   3. [default] section of config.ini
+# Research note: the old ConfigReader re-read the file on every instantiation (once per test
+# through BasePage) and always used [default]. Now pytest sets the active env once in
+# pytest_configure and fixtures + page objects share the same cached snapshot.
+
+CONFIG_PATH = os.environ.get(
+    "AUT_CONFIG_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "config.ini")
+)
+ENV_PREFIX = "AUT_"
+
+_active_env = "default"
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    env: str
+    base_url: str
+    browser: str
+    implicit_wait: int
+    explicit_wait: int
+    page_load_timeout: Optional[int]
+    values: Mapping[str, str] = field(repr=False)   # every resolved key, read-only
+
+    def get(self, key):
+        if key in self.values:
+            return self.values[key]
+        raise KeyError(f"Key '{key}' not found in config for environment '{self.env}' or 'default'.")
+
+
+@functools.lru_cache(maxsize=None)
+def _parsed_file():
+    parser = configparser.ConfigParser()
+    parser.read(os.path.expanduser(CONFIG_PATH))
+    return parser
+
+
+def _to_int(env, key, raw):
+    if raw is None or raw == "":
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"Config key '{key}' for environment '{env}' must be an integer, got '{raw}'") from None
+
+
+@functools.lru_cache(maxsize=None)
+def load_config(env="default"):
+    parser = _parsed_file()
+    values = {}
+    if "default" in parser:
+        values.update(parser["default"])
+    if env != "default" and env in parser:
+        values.update(parser[env])
+    for name, raw in os.environ.items():
+        if name.startswith(ENV_PREFIX) and name != "AUT_CONFIG_PATH":
+            values[name[len(ENV_PREFIX):].lower()] = raw
+    values = {key: value.strip() for key, value in values.items()}
+
+    return ConfigSnapshot(
+        env=env,
+        base_url=values.get("base_url", ""),
+        browser=values.get("browser", "chrome"),
+        implicit_wait=_to_int(env, "implicit_wait", values.get("implicit_wait")) or 0,
+        explicit_wait=_to_int(env, "explicit_wait", values.get("explicit_wait")) or 10,
+        page_load_timeout=_to_int(env, "page_load_timeout", values.get("page_load_timeout")),
+        values=MappingProxyType(values),
+    )
+
+
+# Browser launch profiles: [profile:<name>] sections, chosen with --browser-profile or `browser_profile`
+PROFILE_PREFIX = "profile:"
+
+
+@dataclass(frozen=True)
+class LaunchProfile:
+    name: str
+    page_load_strategy: str = "normal"          # normal / eager / none
+    block_urls: tuple = ()                      # Chrome URL patterns, e.g. *google-analytics.com*
+    block_resource_types: tuple = ()            # image / font / media
+    chrome_args: tuple = ()                     # extra command line switches
+    disable_background: bool = False            # trim background Chrome features
+    user_data_dir: Optional[str] = None         # path, or "warm" for a reusable, lock-claimed dir
+
+
+def _split(raw):
+    return tuple(part.strip() for part in (raw or "").replace("\n", ",").split(",") if part.strip())
+
+
+@functools.lru_cache(maxsize=None)
+def load_profile(name):
+    parser = _parsed_file()
+    section = PROFILE_PREFIX + name
+    if section not in parser:
+        available = [s[len(PROFILE_PREFIX):] for s in parser.sections() if s.startswith(PROFILE_PREFIX)]
+        raise KeyError(f"Browser profile '{name}' not found in config, available: {available}")
+    values = parser[section]
+    return LaunchProfile(
+        name=name,
+        page_load_strategy=values.get("page_load_strategy", "normal").strip(),
+        block_urls=_split(values.get("block_urls")),
+        block_resource_types=_split(values.get("block_resource_types")),
+        chrome_args=_split(values.get("chrome_args")),
+        disable_background=values.getboolean("disable_background", fallback=False),
+        user_data_dir=(values.get("user_data_dir") or "").strip() or None,
+    )
+
+
+def set_active_env(env):
+    # Called once from pytest_configure (in every xdist worker) with the --env option
+    global _active_env
+    _active_env = env
+
+
+def get_config():
+    return load_config(_active_env)
+
 
 class ConfigReader:
-    config_path = './config/config.ini'  # Default path to config file  
-    
-    def __init__(self, env='default'):
-        # Expand user tilde (~) if present
-        self.config_path = os.path.expanduser(self.config_path)
-        self.config = configparser.ConfigParser()
-        self.config.read(self.config_path)
-        self.env = env
+    # Kept for backwards compatibility: a thin view over the cached snapshot
+    def __init__(self, env=None):
+        self.env = env or _active_env
+        self.snapshot = load_config(self.env)
 
     def get(self, key):
-        # First check if the environment-specific section exists
-        if self.env in self.config and key in self.config[self.env]:
-            return self.config[self.env][key]
-        # Fallback to default section
-        elif 'default' in self.config and key in self.config['default']:
-            return self.config['default'][key]
-        else:
-            raise KeyError(f"Key '{key}' not found in config for environment '{self.env}' or 'default'.")
-        
-    
-    
-    
\ No newline at end of file
+        return self.snapshot.get(key)
@@ -1,14 +1,212 @@
 import json
 import csv
+import os
+import threading
+from array import array
+from collections.abc import Mapping
 
 def load_testdata(file_path):
     with open(file_path, 'r') as file:
         return json.load(file)
-    
+
 def load_csvtestdata(file_path):
     data = []
     with open(file_path, 'r') as file:
         reader = csv.DictReader(file)
         for row in reader:
             data.append(row)
-    return data
\ No newline at end of file
+    return data
+
+
+# 🔧 UPDATED: lazy, cached data provider for large data-driven suites.
+# Intention: Collection should only need to know HOW MANY rows a file has, not their content.
+# - Every source is indexed once per process; the index is rebuilt only when the file's mtime/size changes
+#     .csv / .jsonl -> array of byte offsets (8 bytes per row), rows are parsed on demand
+#                      (csv offsets are record boundaries: a quoted field may span lines)
+#     .json         -> parsed once (a JSON array cannot be streamed without extra packages)
+# - Rows are validated against a schema; aliases cover the CSV/JSON column naming difference
+# - shard_indices() spreads rows across separate runs/shards (AUT_DATA_SHARD="index/count")
+# Research note: do NOT shard rows per pytest-xdist worker - xdist requires every worker to
+# collect exactly the same tests. AUT_DATA_SHARD is meant for separate pytest processes.
+
+# canonical field -> accepted column names
+SCHEMAS = {
+    "autosuggestion": {
+        "partial_name": ("partial_name",),
+        "full_name": ("full_name", "full_country_name"),
+    },
+}
+
+_index_cache = {}
+_index_lock = threading.Lock()
+
+
+class _Index:
+    def __init__(self, kind, header=None, offsets=None, rows=None):
+        self.kind = kind          # "csv", "jsonl" or "json"
+        self.header = header      # csv column names
+        self.offsets = offsets    # csv/jsonl byte offsets
+        self.rows = rows          # json parsed rows
+
+    def __len__(self):
+        return len(self.rows) if self.rows is not None else len(self.offsets)
+
+
+def _line_offsets(file, start):
+    offsets = array("q")
+    position = start
+    for line in file:
+        if line.strip():
+            offsets.append(position)
+        position += len(line)
+    return offsets
+
+
+class _CsvLines:
+    # Decoded lines for csv.reader that keeps track of the byte position it has consumed.
+    # csv.reader pulls exactly the lines of one record (more than one when a quoted field
+    # contains a newline), so the position between two records is a record boundary.
+    def __init__(self, file):
+        self.file = file
+        self.position = file.tell()
+
+    def __iter__(self):
+        for line in self.file:
+            self.position += len(line)
+            yield line.decode("utf-8")
+
+
+def _csv_offsets(file):
+    # (header, byte offsets of the data records); blank lines are skipped
+    lines = _CsvLines(file)
+    reader = csv.reader(lines)
+    header = next(reader, [])
+    if header:
+        header[0] = header[0].lstrip("\ufeff")
+    offsets = array("q")
+    while True:
+        start = lines.position
+        record = next(reader, None)
+        if record is None:
+            return header, offsets
+        if record:
+            offsets.append(start)
+
+
+def _build_index(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, "rb") as file:
+            header, offsets = _csv_offsets(file)
+            return _Index("csv", header=header, offsets=offsets)
+    if extension == ".jsonl":
+        with open(path, "rb") as file:
+            return _Index("jsonl", offsets=_line_offsets(file, 0))
+    if extension == ".json":
+        with open(path, "r", encoding="utf-8") as file:
+            rows = json.load(file)
+        if not isinstance(rows, list):
+            raise ValueError(f"{path}: expected a JSON array of rows")
+        return _Index("json", rows=rows)
+    raise ValueError(f"{path}: unsupported data file type '{extension}' (use .csv, .json or .jsonl)")
+
+
+def _get_index(path):
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _index_lock:
+        cached = _index_cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = (key, _build_index(path))
+            _index_cache[path] = cached
+        return cached[1]
+
+
+def parse_shard(spec):
+    # "1/4" -> (1, 4); shards are numbered from 0
+    index, count = (int(part) for part in spec.split("/"))
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid data shard '{spec}', expected 'index/count' with 0 <= index < count")
+    return index, count
+
+
+class DataSource:
+    def __init__(self, path, schema=None):
+        self.path = os.path.abspath(path)
+        self.schema = SCHEMAS[schema] if isinstance(schema, str) else schema
+        index = _get_index(self.path)
+        if index.kind == "csv" and self.schema:
+            self._check_fields(index.header, "header")
+
+    def __len__(self):
+        return len(_get_index(self.path))
+
+    def row(self, number):
+        index = _get_index(self.path)
+        if index.kind == "json":
+            row = index.rows[number]
+        else:
+            with open(self.path, "rb") as file:
+                file.seek(index.offsets[number])
+                if index.kind == "csv":
+                    row = dict(zip(index.header, next(csv.reader(_CsvLines(file)))))
+                else:
+                    row = json.loads(file.readline().decode("utf-8"))
+        if self.schema:
+            self._check_fields(row, f"row {number}")
+        return row
+
+    def canonical_row(self, number):
+        # Row keyed by the schema's canonical names, e.g. full_country_name -> full_name
+        row = self.row(number)
+        if not self.schema:
+            return row
+        return {canonical: next(row[alias] for alias in aliases if alias in row)
+                for canonical, aliases in self.schema.items()}
+
+    def __iter__(self):
+        # Streams rows in file order without holding them all in memory
+        for number in range(len(self)):
+            yield self.row(number)
+
+    def shard_indices(self, shard=None):
+        total = len(self)
+        shard = shard or os.environ.get("AUT_DATA_SHARD")
+        if not shard:
+            return range(total)
+        index, count = parse_shard(shard)
+        return range(index, total, count)
+
+    def lazy_rows(self, shard=None):
+        return [LazyRow(self, number) for number in self.shard_indices(shard)]
+
+    def _check_fields(self, fields, where):
+        missing = [canonical for canonical, aliases in self.schema.items()
+                   if not any(alias in fields for alias in aliases)]
+        if missing:
+            raise ValueError(f"{self.path} {where}: missing field(s) {missing}")
+
+
+class LazyRow(Mapping):
+    # Stand-in for a row dict: used as a pytest parameter, parsed on first access
+    def __init__(self, source, number):
+        self.source = source
+        self.number = number
+        self._row = None
+
+    def _load(self):
+        if self._row is None:
+            self._row = self.source.row(self.number)
+        return self._row
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __repr__(self):
+        return repr(self._load())
@@ -0,0 +1,124 @@
+import functools
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from utils.config_reader import get_config
+
+# Intention: Resolve the chromedriver binary once per machine instead of calling
+# ChromeDriverManager().install() in every test class / worker.
+# Lookup order:
+#   1. CHROMEDRIVER_PATH environment variable or `chromedriver_path` in config.ini (fully offline)
+#   2. Cache file keyed by the installed Chrome major version (fully offline)
+#   3. webdriver-manager download (network) -> result is written back to the cache
+# Research note: The cache only goes stale when Chrome itself is upgraded, because the
+# key is the Chrome major version. A new major version simply misses and re-resolves.
+
+CACHE_DIR = os.environ.get(
+    "DRIVER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "automation-practice")
+)
+CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+
+def _configured_driver_path():
+    path = os.environ.get("CHROMEDRIVER_PATH")
+    if not path:
+        path = get_config().values.get("chromedriver_path")
+    if path and os.path.isfile(os.path.expanduser(path)):
+        return os.path.expanduser(path)
+    return None
+
+
+def detect_chrome_major_version():
+    # Returns e.g. "131", or None when no browser can be found
+    candidates = [os.environ.get("CHROME_BINARY")] + CHROME_BINARIES
+    for binary in filter(None, candidates):
+        if not (os.path.isfile(binary) or shutil.which(binary)):
+            continue
+        try:
+            output = subprocess.run(
+                [binary, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+\.\d+", output)
+        if match:
+            return match.group(1)
+
+    if sys.platform.startswith("win"):
+        try:
+            output = subprocess.run(
+                ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+                capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = re.search(r"(\d+)\.\d+\.\d+", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _read_cache():
+    try:
+        with open(CACHE_FILE, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json_atomic(path, payload):
+    # Write to a temp file first and swap it in, so parallel workers never read half a file
+    # (also used for the state files of utils/browser_daemon.py)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w") as file:
+        json.dump(payload, file, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _write_cache(cache):
+    write_json_atomic(CACHE_FILE, cache)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_chromedriver():
+    # lru_cache -> resolved at most once per process, every later call is free
+    configured = _configured_driver_path()
+    if configured:
+        return configured
+
+    major = detect_chrome_major_version()
+    cache = _read_cache()
+
+    cached = cache.get(major) if major else None
+    if cached and os.path.isfile(cached):
+        return cached
+
+    if major is None:
+        # Browser version unknown: trust any cached driver that still exists on disk
+        for path in cache.values():
+            if os.path.isfile(path):
+                return path
+
+    # Cache miss -> the only step that may touch the network
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+
+    if major:
+        cache[major] = path
+        _write_cache(cache)
+    return path
@@ -0,0 +1,173 @@
+import itertools
+import os
+import socket
+import sys
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from utils.driver_cache import CACHE_DIR, resolve_chromedriver
+
+
+# Intention: One place that knows how to build a browser.
+# The driver fixture and the browser pool both call create_driver(), so every
+# worker process launches Chrome exactly the same way.
+# `config` is the ConfigSnapshot of the active environment (utils/config_reader.py).
+# `profile` is the LaunchProfile of [profile:<name>] in config.ini (fast / fidelity).
+
+# Switches that stop Chrome doing background work a test never needs
+BACKGROUND_SWITCHES = (
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+)
+
+# Resource types -> URL patterns for Network.setBlockedURLs
+RESOURCE_PATTERNS = {
+    "image": ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"),
+    "font": ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"),
+    "media": ("*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav"),
+}
+
+# Warm profile dirs are claimed slot by slot (<profile>-0, <profile>-1, ...) with an OS file lock.
+# Chrome refuses a user-data-dir another Chrome is using, and xdist workers, shards and parallel
+# local runs all start browsers at the same time. The lock is released when the process exits,
+# so the next run picks the same warm dir up again.
+_claimed_slots = []     # open lock files, kept for the lifetime of the process
+
+
+def _try_lock(handle):
+    try:
+        if sys.platform.startswith("win"):
+            import msvcrt
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _chrome_still_running(path):
+    # Chrome marks a user-data-dir in use with a SingletonLock symlink to "<host>-<pid>".
+    # After a crash or kill -9 the link stays behind, so only a live pid counts.
+    try:
+        target = os.readlink(os.path.join(path, "SingletonLock"))
+    except OSError:
+        return False    # no lock (or not a symlink: Windows uses a locked file instead)
+    host, _, pid = target.rpartition("-")
+    if host != socket.gethostname() or not pid.isdigit():
+        return True     # another machine's Chrome (shared home dir): cannot check, keep away
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True     # exists, owned by another user
+    return True
+
+
+def _warm_user_data_dir(profile):
+    root = os.path.join(CACHE_DIR, "chrome-profiles")
+    os.makedirs(root, exist_ok=True)
+    for slot in itertools.count():
+        path = os.path.join(root, f"{profile.name}-{slot}")
+        # Still used by a browser that outlived its run (--reuse-browser daemon)
+        if _chrome_still_running(path):
+            continue
+        handle = open(path + ".lock", "a")
+        if _try_lock(handle):
+            _claimed_slots.append(handle)
+            return path
+        handle.close()
+
+
+def _apply_profile(options, profile):
+    options.page_load_strategy = profile.page_load_strategy
+
+    if profile.disable_background:
+        for switch in BACKGROUND_SWITCHES:
+            options.add_argument(switch)
+    for switch in profile.chrome_args:
+        options.add_argument(switch)
+
+    if "image" in profile.block_resource_types:
+        # Images are also switched off at the content-settings level (no decode work at all)
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    if profile.user_data_dir:
+        path = _warm_user_data_dir(profile) if profile.user_data_dir == "warm" else profile.user_data_dir
+        options.add_argument(f"--user-data-dir={os.path.expanduser(path)}")
+
+
+def _block_urls(driver, profile):
+    patterns = list(profile.block_urls)
+    for resource_type in profile.block_resource_types:
+        if resource_type not in RESOURCE_PATTERNS:
+            raise ValueError(f"Unknown resource type '{resource_type}' in profile '{profile.name}', "
+                             f"expected one of {sorted(RESOURCE_PATTERNS)}")
+        patterns.extend(RESOURCE_PATTERNS[resource_type])
+    if patterns:
+        # Chrome DevTools Protocol: blocked requests fail immediately instead of loading
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def build_options(headless=False, profile=None):
+    options = webdriver.ChromeOptions()
+
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+
+    if profile:
+        _apply_profile(options, profile)
+    return options
+
+
+def apply_timeouts(driver, config):
+    # Timeouts from config.ini ([env] section or AUT_* environment variables)
+    if config.implicit_wait:
+        driver.implicitly_wait(config.implicit_wait)
+    # SmartWait.until switches it off while it polls and restores this value afterwards
+    driver.configured_implicit_wait = config.implicit_wait
+    if config.page_load_timeout:
+        driver.set_page_load_timeout(config.page_load_timeout)
+
+
+def prepare_new_browser(driver, config, profile=None):
+    # Everything done once right after a browser starts (also used by utils/browser_daemon.py)
+    driver.maximize_window()
+    if profile:
+        _block_urls(driver, profile)
+    apply_timeouts(driver, config)
+    return driver
+
+
+def create_driver(config, headless=False, profile=None):
+    service = Service(resolve_chromedriver())   # 🔧 UPDATED: cached, offline-first lookup
+    options = build_options(headless=headless, profile=profile)
+    driver = webdriver.Chrome(service=service, options=options)
+    return prepare_new_browser(driver, config, profile)
+
+
+def time_to_interactive(driver):
+    # Navigation Timing of the current page in ms from navigation start (None when unavailable)
+    return driver.execute_script("""
+        var nav = performance.getEntriesByType('navigation')[0];
+        if (!nav) { return null; }
+        return {
+            interactive: Math.round(nav.domInteractive),
+            dom_content_loaded: Math.round(nav.domContentLoadedEventEnd),
+            load: Math.round(nav.loadEventEnd)
+        };
+    """)
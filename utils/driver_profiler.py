@@ -0,0 +1,169 @@
+import contextlib
+import sys
+import time
+from collections import defaultdict
+
+# Intention: Opt-in (--profile-driver) instrumentation of every WebDriver command.
+# - instrument(driver) wraps driver.execute, which every driver AND WebElement call goes through
+# - wait_span() is used by BasePage around its WebDriverWait polling, so wait time is counted separately
+# - every command is attributed to the current test and to the page-object/flow method that issued it
+# Research note: When profiling is off, ACTIVE is None and both helpers are no-ops,
+# so the normal run pays nothing for this module.
+
+ACTIVE = None
+
+# Modules whose methods we report on, most specific first
+_OWNER_PREFIXES = ("pages.", "flows.", "base.")
+
+
+def enable():
+    global ACTIVE
+    ACTIVE = DriverProfiler()
+    return ACTIVE
+
+
+def instrument(driver):
+    if ACTIVE is not None:
+        ACTIVE.instrument(driver)
+    return driver
+
+
+def wait_span():
+    if ACTIVE is None:
+        return contextlib.nullcontext()
+    return ACTIVE.wait_span()
+
+
+def _issuing_method():
+    # Walk up the call stack and return "Class.method" of the nearest page object / flow.
+    # BasePage frames are only used when a test calls a BasePage method directly.
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_OWNER_PREFIXES):
+            owner = frame.f_locals.get("self")
+            name = f"{type(owner).__name__}.{frame.f_code.co_name}" if owner is not None else frame.f_code.co_name
+            if not module.startswith("base."):
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback or "<fixture/test>"
+
+
+class _TestStats:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.started = time.perf_counter()
+        self.commands = defaultdict(lambda: [0, 0.0])   # command -> [count, seconds]
+        self.methods = defaultdict(lambda: [0, 0.0, 0.0])  # method -> [commands, seconds, wait seconds]
+        self.wait_time = 0.0
+
+    def summary(self):
+        total_time = sum(seconds for _, seconds in self.commands.values())
+        return {
+            "test": self.nodeid,
+            "duration_s": round(time.perf_counter() - self.started, 4),
+            "round_trips": sum(count for count, _ in self.commands.values()),
+            "command_time_s": round(total_time, 4),
+            "wait_time_s": round(self.wait_time, 4),
+            "commands": {name: {"count": c, "time_s": round(t, 4)} for name, (c, t) in
+                         sorted(self.commands.items(), key=lambda kv: -kv[1][1])},
+            "methods": {name: {"round_trips": c, "time_s": round(t, 4), "wait_s": round(w, 4)} for name, (c, t, w) in
+                        sorted(self.methods.items(), key=lambda kv: -kv[1][1])},
+        }
+
+
+class DriverProfiler:
+    def __init__(self):
+        self.current = None
+        self.session_methods = defaultdict(lambda: [0, 0, 0.0, 0.0])  # method -> [calls, commands, seconds, wait]
+        self._wait_depth = 0
+
+    def instrument(self, driver):
+        if getattr(driver, "_profiled", False):
+            return driver
+        original_execute = driver.execute
+
+        def execute(command, params=None):
+            started = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                self._record(command, time.perf_counter() - started)
+
+        driver.execute = execute
+        driver._profiled = True
+        return driver
+
+    def _record(self, command, seconds):
+        method = _issuing_method()
+        session = self.session_methods[method]
+        session[1] += 1
+        session[2] += seconds
+        if self.current is None:
+            return
+        self.current.commands[command][0] += 1
+        self.current.commands[command][1] += seconds
+        self.current.methods[method][0] += 1
+        self.current.methods[method][1] += seconds
+
+    @contextlib.contextmanager
+    def wait_span(self):
+        # Nested waits (wait inside wait) are only counted once
+        method = _issuing_method()
+        self._wait_depth += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._wait_depth -= 1
+            if self._wait_depth == 0:
+                seconds = time.perf_counter() - started
+                self.session_methods[method][3] += seconds
+                if self.current is not None:
+                    self.current.wait_time += seconds
+                    self.current.methods[method][2] += seconds
+
+    def start_test(self, nodeid):
+        self.current = _TestStats(nodeid)
+
+    def finish_test(self):
+        if self.current is None:
+            return None
+        summary = self.current.summary()
+        for method in summary["methods"]:
+            self.session_methods[method][0] += 1
+        self.current = None
+        return summary
+
+    def export_session(self):
+        # Plain dict/lists, so an xdist worker can send it to the controller (workeroutput)
+        return {method: list(stats) for method, stats in self.session_methods.items()}
+
+    def merge_session(self, exported):
+        for method, stats in exported.items():
+            merged = self.session_methods[method]
+            for i, value in enumerate(stats):
+                merged[i] += value
+
+    def session_table(self, limit=15):
+        rows = sorted(self.session_methods.items(), key=lambda kv: -(kv[1][2] + kv[1][3]))[:limit]
+        lines = [
+            f"{'page-object method':<55}{'tests':>7}{'cmds':>8}{'cmd s':>10}{'wait s':>10}",
+            "-" * 90,
+        ]
+        for method, (tests, commands, seconds, wait) in rows:
+            lines.append(f"{method:<55}{tests:>7}{commands:>8}{seconds:>10.3f}{wait:>10.3f}")
+        return "\n".join(lines)
+
+
+def format_summary(summary):
+    lines = [
+        f"Driver profile for {summary['test']}: {summary['round_trips']} round-trips, "
+        f"{summary['command_time_s']}s in commands, {summary['wait_time_s']}s waiting "
+        f"(test took {summary['duration_s']}s)"
+    ]
+    for name, stats in summary["methods"].items():
+        lines.append(f"  {name:<50} {stats['round_trips']:>4} cmds {stats['time_s']:>8.3f}s  wait {stats['wait_s']:.3f}s")
+    return "\n".join(lines)
@@ -0,0 +1,38 @@
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+# Intention: Serve the bundled replica of the Automation Practice page from inside the
+# test process, so `--env=local` runs without internet and without third-party assets.
+SITE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "local_site")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    # Research note: SimpleHTTPRequestHandler prints every request to stderr,
+    # which would spam the pytest output. We rely on our own logger instead.
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSiteServer:
+    def __init__(self, host="127.0.0.1", port=0, root=SITE_ROOT):
+        # port=0 -> the OS picks a free port (safe for parallel workers)
+        handler = functools.partial(_QuietHandler, directory=root)
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/AutomationPractice/"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join(timeout=5)
@@ -1,14 +1,146 @@
-from datetime import datetime
+from datetime import datetime, timezone
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
+
+# Intention: Logging that never blocks the test thread on file I/O.
+# Test thread -> QueueHandler (just puts the record on a queue)
+#             -> QueueListener thread -> RotatingFileHandler writing JSON lines
+# Every worker process (pytest-xdist gw0, gw1, ... or "main") writes its own file, and the pid
+# is part of the name, so parallel workers and concurrent runs never share a file.
+# Research note: the old version called logging.basicConfig with a FileHandler named per minute,
+# so two runs started in the same minute wrote into the same file.
+# 🔧 UPDATED: get_logger() is cheap at import time. The listener thread, logs/ and the log file
+# only come to life with the first record, so collection (--collect-only, -k) starts nothing.
+
+LOG_DIR = "logs"
+LOGGER_NAME = "automation"
+MAX_BYTES = int(os.environ.get("AUT_LOG_MAX_BYTES", 5 * 1024 * 1024))
+BACKUP_COUNT = int(os.environ.get("AUT_LOG_BACKUP_COUNT", 5))
+
+_current_test = contextvars.ContextVar("current_test", default=None)  # (nodeid, start perf_counter)
+_listener = None
+_listener_queue = None
+_shut_down = False
+_setup_lock = threading.Lock()
+
+
+def worker_id():
+    # pytest-xdist exports PYTEST_XDIST_WORKER (gw0, gw1, ...) to every worker process
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def set_test_context(nodeid):
+    _current_test.set((nodeid, time.perf_counter()))
+
+
+def clear_test_context():
+    _current_test.set(None)
+
+
+class _TestContextFilter(logging.Filter):
+    # Runs on the test thread (inside QueueHandler), so it sees the current test
+    def filter(self, record):
+        context = _current_test.get()
+        record.nodeid = context[0] if context else None
+        record.test_elapsed_ms = round((time.perf_counter() - context[1]) * 1000, 1) if context else None
+        record.worker = worker_id()
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "worker": getattr(record, "worker", None),
+            "pid": record.process,
+            "nodeid": getattr(record, "nodeid", None),
+            "test_elapsed_ms": getattr(record, "test_elapsed_ms", None),
+        }
+        if record.exc_info:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _log_file_path():
+    timestamp = datetime.now().strftime("%Y-%m-%d,%H%M%S")
+    return os.path.join(LOG_DIR, f"automation_logger-{timestamp}-{worker_id()}-{os.getpid()}.jsonl")
+
+
+def _start_listener():
+    global _listener
+    with _setup_lock:
+        if _listener is not None or _shut_down:
+            return
+        os.makedirs(LOG_DIR, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            _log_file_path(), maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8", delay=True
+        )
+        file_handler.setFormatter(JsonLinesFormatter())
+
+        _listener = logging.handlers.QueueListener(_listener_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+_traceback_formatter = logging.Formatter()
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    # Starts the listener thread (and with it the log file) on the first record
+    def enqueue(self, record):
+        if _listener is None:
+            _start_listener()
+        super().enqueue(record)
+
+    def prepare(self, record):
+        # QueueHandler.prepare folds the traceback into the message and drops exc_info.
+        # Keep them apart: the traceback is rendered here (the frames die with this call)
+        # and travels as exc_text, which JsonLinesFormatter writes as its own field.
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _traceback_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def _configure(logger):
+    global _listener_queue
+    _listener_queue = queue.SimpleQueue()
+    queue_handler = _LazyQueueHandler(_listener_queue)
+    queue_handler.addFilter(_TestContextFilter())
+
+    logger.setLevel(logging.INFO)
+    logger.addHandler(queue_handler)
+
+
+def shutdown_logging():
+    # Flushes every queued record to disk; safe to call more than once
+    global _listener, _shut_down
+    with _setup_lock:
+        _shut_down = True
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
 
 
 def get_logger():
-    os.makedirs('logs', exist_ok = True)
-    log_file = f"logs/automation_logger-{datetime.now().strftime('%Y-%m-%d,%H%M')}.log"
-    logging.basicConfig(
-        filename = log_file,
-        level = logging.INFO,
-        format = '%(asctime)s | %(levelname)s : %(message)s'
-    )
-    return logging.getLogger()
\ No newline at end of file
+    logger = logging.getLogger(LOGGER_NAME)
+    with _setup_lock:
+        if _listener_queue is None and not logger.handlers:
+            _configure(logger)
+    return logger
@@ -0,0 +1,199 @@
+import json
+import os
+import statistics
+import sys
+import time
+
+from utils.config_reader import load_config
+from utils.logger import worker_id
+
+# Intention: Use the smoke suite as a cheap page-performance probe (opt-in with --page-metrics).
+# After every real page load (the driver fixture's initial get, or a reload fallback in
+# refresh_page) we read Navigation Timing, Resource Timing and long tasks from the browser.
+# - One compact JSON line per load in reports/page_metrics/<env>.jsonl (a time series per env)
+# - Resources are summarised (count, bytes, slowest 5), never stored one by one
+# - Long tasks need an observer that exists before the page starts; it is registered through
+#   the DevTools Page.addScriptToEvaluateOnNewDocument command
+# - load_budget_ms in config.ini (per env) flags slow environments in the run summary
+#
+#   python -m utils.page_metrics reports/page_metrics/uat.jsonl     # aggregate every run in a file
+#
+# Research note: under pytest-xdist every worker appends its own lines; lines are tagged with a
+# run id so the controller can aggregate just this run from the shared file.
+
+METRICS_DIR = os.path.join("reports", "page_metrics")
+RUN_ID_VARIABLE = "PAGE_METRICS_RUN_ID"
+
+LONGTASK_OBSERVER_JS = """
+if (!window.__autLongTasks && window.PerformanceObserver) {
+    window.__autLongTasks = [];
+    try {
+        new PerformanceObserver(function (list) {
+            list.getEntries().forEach(function (entry) {
+                window.__autLongTasks.push([Math.round(entry.startTime), Math.round(entry.duration)]);
+            });
+        }).observe({type: 'longtask', buffered: true});
+    } catch (e) { /* longtask not supported by this browser */ }
+}
+"""
+
+_COLLECT_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+var resources = performance.getEntriesByType('resource');
+var byType = {};
+var transfer = 0;
+resources.forEach(function (r) {
+    byType[r.initiatorType] = (byType[r.initiatorType] || 0) + 1;
+    transfer += r.transferSize || 0;
+});
+var slowest = resources.slice().sort(function (a, b) { return b.duration - a.duration; })
+    .slice(0, 5).map(function (r) { return [r.name, Math.round(r.duration)]; });
+var tasks = window.__autLongTasks || null;
+return {
+    url: location.href,
+    navigation: {
+        type: nav.type,
+        ttfb: Math.round(nav.responseStart),
+        interactive: Math.round(nav.domInteractive),
+        dom_content_loaded: Math.round(nav.domContentLoadedEventEnd),
+        // page_load_strategy=eager hands the page over before the load event -> best value so far
+        load: Math.round(nav.loadEventEnd || nav.domContentLoadedEventEnd || nav.domInteractive),
+        load_complete: nav.loadEventEnd > 0,
+        transfer_bytes: nav.transferSize || 0
+    },
+    resources: {count: resources.length, transfer_bytes: transfer, by_type: byType, slowest: slowest},
+    long_tasks: tasks === null ? null : {
+        count: tasks.length,
+        total_ms: tasks.reduce(function (sum, t) { return sum + t[1]; }, 0),
+        max_ms: tasks.reduce(function (max, t) { return Math.max(max, t[1]); }, 0)
+    }
+};
+"""
+
+
+def install_observers(driver):
+    # Once per browser: the observer script then runs in every document this browser opens
+    if getattr(driver, "_page_metrics_installed", False):
+        return True
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": LONGTASK_OBSERVER_JS})
+    except Exception:
+        return False    # no DevTools access -> long_tasks stays null
+    driver._page_metrics_installed = True
+    return True
+
+
+def collect(driver):
+    # Metrics of the currently loaded document, or None when the browser has no Navigation Timing
+    return driver.execute_script(_COLLECT_JS)
+
+
+class PageMetricsRecorder:
+    def __init__(self, env, budget_ms=None, directory=METRICS_DIR, run_id=None):
+        self.env = env
+        self.budget_ms = budget_ms
+        self.path = os.path.join(directory, f"{env}.jsonl")
+        self.run_id = run_id or os.environ.get(RUN_ID_VARIABLE) or time.strftime("%Y%m%d-%H%M%S")
+
+    def record(self, test, kind, metrics):
+        # kind: "initial" (driver fixture) or "reload" (refresh_page fallback / reload marker)
+        entry = {
+            "ts": round(time.time(), 3),
+            "run": self.run_id,
+            "env": self.env,
+            "worker": worker_id(),
+            "test": test,
+            "kind": kind,
+        }
+        entry.update(metrics)
+        entry["over_budget"] = bool(self.budget_ms and metrics["navigation"]["load"] > self.budget_ms)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # One short line per write in append mode, so concurrent workers do not interleave lines
+        with open(self.path, "a") as file:
+            file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        return entry
+
+
+def read_entries(path, run_id=None):
+    entries = []
+    try:
+        with open(path, "r") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if run_id is None or entry.get("run") == run_id:
+                    entries.append(entry)
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round((len(ordered) - 1) * fraction)))]
+
+
+def load_budget(env):
+    # load_budget_ms of the env in config.ini (or AUT_LOAD_BUDGET_MS), None when not set
+    raw = load_config(env).values.get("load_budget_ms")
+    return int(raw) if raw else None
+
+
+def summarize(entries, budgets=None):
+    # Per env: load/interactive medians, p95 load, long tasks and loads over the budget
+    summaries = {}
+    for env in sorted({entry["env"] for entry in entries}):
+        budget_ms = (budgets or {}).get(env)
+        rows = [entry for entry in entries if entry["env"] == env]
+        loads = [row["navigation"]["load"] for row in rows]
+        long_tasks = [row["long_tasks"]["count"] for row in rows if row.get("long_tasks")]
+        p95 = _percentile(loads, 0.95)
+        summaries[env] = {
+            "loads": len(rows),
+            "median_interactive_ms": statistics.median(row["navigation"]["interactive"] for row in rows),
+            "median_load_ms": statistics.median(loads),
+            "p95_load_ms": p95,
+            "long_tasks": sum(long_tasks) if long_tasks else None,
+            "over_budget": sum(1 for load in loads if budget_ms and load > budget_ms),
+            "budget_ms": budget_ms,
+            "exceeded": bool(budget_ms and p95 > budget_ms),
+        }
+    return summaries
+
+
+def format_summary(env, summary):
+    line = (f"{env}: {summary['loads']} load(s), median interactive {summary['median_interactive_ms']:.0f} ms, "
+            f"median load {summary['median_load_ms']:.0f} ms, p95 load {summary['p95_load_ms']} ms")
+    if summary["long_tasks"] is not None:
+        line += f", {summary['long_tasks']} long task(s)"
+    if summary["budget_ms"]:
+        line += f", budget {summary['budget_ms']} ms"
+        if summary["exceeded"]:
+            line += f" -> OVER BUDGET ({summary['over_budget']} load(s) above it)"
+    return line
+
+
+def main(paths):
+    for path in paths:
+        entries = read_entries(path)
+        budgets = {env: load_budget(env) for env in {entry["env"] for entry in entries}}
+        for env, summary in summarize(entries, budgets).items():
+            print(format_summary(env, summary))
+    return 0
+
+
+def default_paths():
+    # Every env file of reports/page_metrics, or None before the first --page-metrics run
+    if not os.path.isdir(METRICS_DIR):
+        return None
+    return [os.path.join(METRICS_DIR, name) for name in sorted(os.listdir(METRICS_DIR)) if name.endswith(".jsonl")]
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or default_paths()
+    if not paths:
+        print(f"No page metrics in {METRICS_DIR} yet, run pytest with --page-metrics first")
+        sys.exit(1)
+    sys.exit(main(paths))
@@ -0,0 +1,119 @@
+from selenium.common.exceptions import UnexpectedAlertPresentException, WebDriverException
+
+# Intention: Put the page back into its "just loaded" state without a network reload.
+# 1. snapshot() once after driver.get(): remember url + form/visibility state of the page
+# 2. reset() before every test: restore that state in-page with a single execute_script
+# 3. If the restore is impossible (navigated away, alert still open, element gone) -> driver.refresh()
+# Strategies (chosen per test with @pytest.mark.page_reset("..."), default "soft"):
+#   soft   -> in-page restore, reload only as fallback
+#   reload -> always driver.refresh() (old behaviour)
+#   none   -> leave the page as the previous test left it
+
+STRATEGIES = ("soft", "reload", "none")
+
+_SNAPSHOT_SCRIPT = """
+var controls = document.querySelectorAll('input, select, textarea');
+var state = {url: location.href, controls: [], styled: []};
+for (var i = 0; i < controls.length; i++) {
+    var el = controls[i];
+    state.controls.push({value: el.value, checked: !!el.checked, selectedIndex: el.selectedIndex});
+}
+var styled = document.querySelectorAll('[id]');
+for (var j = 0; j < styled.length; j++) {
+    state.styled.push({id: styled[j].id, style: styled[j].getAttribute('style')});
+}
+return state;
+"""
+
+# Close every autosuggestion menu (jQuery UI on the real page, plain list on the replica).
+# jQuery UI only HIDES its <ul> on close and keeps the old items, so the menus are emptied too.
+# Also used by PracticePage between the rows of a batch.
+CLOSE_MENUS_JS = """
+if (window.jQuery && jQuery.ui && jQuery.ui.autocomplete) {
+    jQuery('.ui-autocomplete-input').each(function () {
+        if (jQuery(this).autocomplete('instance')) { jQuery(this).autocomplete('close'); }
+    });
+}
+var menus = document.querySelectorAll('.ui-autocomplete');
+for (var k = 0; k < menus.length; k++) { menus[k].style.display = 'none'; menus[k].innerHTML = ''; }
+"""
+
+_RESTORE_SCRIPT = """
+var state = arguments[0];
+if (location.href !== state.url) { return false; }
+
+var controls = document.querySelectorAll('input, select, textarea');
+if (controls.length !== state.controls.length) { return false; }
+for (var i = 0; i < controls.length; i++) {
+    var el = controls[i], saved = state.controls[i];
+    if (el.type === 'checkbox' || el.type === 'radio') { el.checked = saved.checked; }
+    else if (el.tagName === 'SELECT') { el.selectedIndex = saved.selectedIndex; }
+    else if (el.type !== 'submit' && el.type !== 'button' && el.type !== 'file') { el.value = saved.value; }
+}
+for (var j = 0; j < state.styled.length; j++) {
+    var target = document.getElementById(state.styled[j].id);
+    if (!target) { return false; }
+    if (state.styled[j].style === null) { target.removeAttribute('style'); }
+    else { target.setAttribute('style', state.styled[j].style); }
+}
+
+""" + CLOSE_MENUS_JS + """
+if (document.activeElement && document.activeElement.blur) { document.activeElement.blur(); }
+window.scrollTo(0, 0);
+return true;
+"""
+
+
+class PageResetEngine:
+    def __init__(self, driver, logger=None):
+        self.driver = driver
+        self.logger = logger
+        self.state = None
+        self.pristine = False   # True until the first test runs after snapshot() -> nothing to restore yet
+
+    def snapshot(self):
+        self.state = self.driver.execute_script(_SNAPSHOT_SCRIPT)
+        self.pristine = True
+
+    def reset(self, strategy="soft"):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown page reset strategy '{strategy}', expected one of {STRATEGIES}")
+
+        # Every reset() hands the page to a test, even "none": afterwards it is no longer pristine
+        pristine, self.pristine = self.pristine, False
+        if strategy == "none":
+            return "none"
+        if strategy == "reload" or self.state is None:
+            return self._reload()
+
+        if pristine:
+            return "soft"
+        try:
+            restored = self.driver.execute_script(_RESTORE_SCRIPT, self.state)
+        except UnexpectedAlertPresentException:
+            # A previous test left an alert open -> get rid of it and reload
+            self._dismiss_alert()
+            restored = False
+        except WebDriverException as e:
+            if self.logger:
+                self.logger.warning(f"In-page reset failed, falling back to reload: {e.msg}")
+            restored = False
+
+        if not restored:
+            return self._reload()
+        return "soft"
+
+    def _reload(self):
+        try:
+            self.driver.refresh()
+        except UnexpectedAlertPresentException:
+            self._dismiss_alert()
+            self.driver.refresh()
+        self.pristine = False
+        return "reload"
+
+    def _dismiss_alert(self):
+        try:
+            self.driver.switch_to.alert.accept()
+        except WebDriverException:
+            pass
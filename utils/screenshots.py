@@ -0,0 +1,169 @@
+import glob
+import hashlib
+import io
+import os
+import queue
+import re
+import threading
+import time
+
+from utils.config_reader import get_config
+
+# Intention: Failure screenshots without stalling the next test.
+# 1. The hook captures the page ONCE (get_screenshot_as_png) and attaches the bytes to Allure.
+# 2. The bytes are handed to a background thread which:
+#    - skips images identical to one already on disk (sha256 in the file name)
+#    - optionally recompresses them (needs Pillow, skipped when not installed)
+#    - applies the retention policy (max files / max bytes / max age) from config.ini
+# Research note: allure.attach must run on the test thread, because Allure finds the running
+# test through thread-local state. Only the disk work is moved off the test thread.
+
+SCREENSHOT_DIR = "screenshots"
+_HASH_IN_NAME = re.compile(r"_([0-9a-f]{12})\.png$")
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def _flag(value):
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+class ScreenshotWriter:
+    def __init__(self, directory=SCREENSHOT_DIR, max_files=None, max_bytes=None, max_age_days=None,
+                 dedupe=True, recompress=False, logger=None):
+        self.directory = directory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.dedupe = dedupe
+        self.recompress = recompress
+        self.logger = logger
+        self._queue = queue.Queue()
+        self._known_hashes = {}
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, logger=None):
+        values = get_config().values
+        return cls(
+            max_files=int(values["screenshot_max_files"]) if values.get("screenshot_max_files") else None,
+            max_bytes=int(values["screenshot_max_bytes"]) if values.get("screenshot_max_bytes") else None,
+            max_age_days=float(values["screenshot_max_age_days"]) if values.get("screenshot_max_age_days") else None,
+            dedupe=_flag(values.get("screenshot_dedupe", "true")),
+            recompress=_flag(values.get("screenshot_recompress", "false")),
+            logger=logger,
+        )
+
+    def submit(self, name, png):
+        # Called on the test thread: just enqueue, no disk I/O
+        self._queue.put((name, png))
+
+    def close(self):
+        # Waits until every queued screenshot is written
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._index_existing()
+        self._apply_retention()
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            try:
+                self._write(*job)
+                self._apply_retention()
+            except Exception as e:
+                self._log("error", f"Failed to write screenshot {job[0]}: {e}")
+
+    def _index_existing(self):
+        for path in glob.glob(os.path.join(self.directory, "*.png")):
+            match = _HASH_IN_NAME.search(path)
+            if match:
+                self._known_hashes[match.group(1)] = path
+
+    def _write(self, name, png):
+        digest = hashlib.sha256(png).hexdigest()[:12]
+        existing = self._known_hashes.get(digest)
+        if self.dedupe and existing and os.path.exists(existing):
+            self._log("info", f"Screenshot for {name} identical to {existing}, not stored again")
+            return
+
+        if self.recompress:
+            png = self._recompress(png)
+
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.directory, f"{name}_{timestamp}_{digest}.png")
+        with open(path, "wb") as file:
+            file.write(png)
+        self._known_hashes[digest] = path
+        self._log("info", f"Screenshot saved to {path}")
+
+    def _recompress(self, png):
+        try:
+            from PIL import Image   # optional dependency
+        except ImportError:
+            self._log("warning", "screenshot_recompress is on but Pillow is not installed, keeping original PNG")
+            self.recompress = False
+            return png
+        out = io.BytesIO()
+        Image.open(io.BytesIO(png)).save(out, format="PNG", optimize=True)
+        smaller = out.getvalue()
+        return smaller if len(smaller) < len(png) else png
+
+    def _apply_retention(self):
+        files = []
+        for path in glob.glob(os.path.join(self.directory, "*.png")):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()   # oldest first
+
+        now = time.time()
+        keep = []
+        for mtime, size, path in files:
+            if self.max_age_days is not None and now - mtime > self.max_age_days * 86400:
+                self._remove(path)
+            else:
+                keep.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in keep)
+        while keep and ((self.max_files is not None and len(keep) > self.max_files) or
+                        (self.max_bytes is not None and total > self.max_bytes)):
+            _, size, path = keep.pop(0)
+            total -= size
+            self._remove(path)
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        match = _HASH_IN_NAME.search(path)
+        if match and self._known_hashes.get(match.group(1)) == path:
+            del self._known_hashes[match.group(1)]
+
+    def _log(self, level, message):
+        if self.logger:
+            getattr(self.logger, level)(message)
+
+
+def get_writer(logger=None):
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ScreenshotWriter.from_config(logger=logger)
+    return _writer
+
+
+def close_writer():
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
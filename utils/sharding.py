@@ -0,0 +1,137 @@
+import glob
+import html
+import json
+import os
+import shutil
+import statistics
+import xml.etree.ElementTree as ET
+
+# Intention: Helpers for `python run_test.py --shards N`.
+# - partition(): balanced split of test ids, weighted by historical duration when known
+# - merge_durations(): keep reports/test_durations.json up to date for the next split
+# - merge_allure_results() / write_merged_html(): one report for all shards
+# Research note: Longest-processing-time-first greedy (biggest test goes to the lightest shard)
+# is simple and lands within ~4/3 of the optimal split, which is plenty for UI suites.
+
+DURATIONS_FILE = os.path.join("reports", "test_durations.json")
+
+
+def load_durations(path=DURATIONS_FILE):
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def partition(test_ids, shard_count, durations=None):
+    durations = durations or {}
+    known = [durations[test_id] for test_id in test_ids if test_id in durations]
+    # Unknown tests weigh as much as a typical known test; with no history every test weighs 1
+    default_weight = statistics.median(known) if known else 1.0
+    weighted = sorted(((durations.get(test_id, default_weight), test_id) for test_id in test_ids), reverse=True)
+
+    shards = [{"ids": [], "weight": 0.0} for _ in range(shard_count)]
+    for weight, test_id in weighted:
+        lightest = min(shards, key=lambda shard: shard["weight"])
+        lightest["ids"].append(test_id)
+        lightest["weight"] += weight
+
+    # Keep collection order inside a shard so class-scoped fixtures are reused
+    order = {test_id: position for position, test_id in enumerate(test_ids)}
+    for shard in shards:
+        shard["ids"].sort(key=order.get)
+    return [shard for shard in shards if shard["ids"]]
+
+
+def merge_durations(shard_files, path=DURATIONS_FILE):
+    durations = load_durations(path)
+    for shard_file in shard_files:
+        durations.update(load_durations(shard_file))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(durations, file, indent=2, sort_keys=True)
+    return durations
+
+
+def merge_allure_results(shard_dirs, target_dir):
+    # Allure result files are uuid-named, so copying them side by side is a valid merge
+    os.makedirs(target_dir, exist_ok=True)
+    copied = 0
+    for shard_dir in shard_dirs:
+        for path in glob.glob(os.path.join(shard_dir, "*")):
+            shutil.copy2(path, target_dir)
+            copied += 1
+    return copied
+
+
+def combine_exit_codes(codes):
+    # 0 all passed, 1 tests failed, 5 nothing collected; anything else is an internal/usage error
+    if any(code not in (0, 1, 5) for code in codes):
+        return next(code for code in codes if code not in (0, 1, 5))
+    if 1 in codes:
+        return 1
+    if codes and all(code == 5 for code in codes):
+        return 5
+    return 0
+
+
+def _read_junit(path):
+    cases = []
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return cases
+    for case in root.iter("testcase"):
+        outcome, message = "passed", ""
+        for tag in ("failure", "error", "skipped"):
+            child = case.find(tag)
+            if child is not None:
+                outcome = {"failure": "failed", "error": "error", "skipped": "skipped"}[tag]
+                message = child.get("message", "")
+                break
+        cases.append({
+            "name": f"{case.get('classname')}::{case.get('name')}",
+            "outcome": outcome,
+            "time": float(case.get("time", 0) or 0),
+            "message": message,
+        })
+    return cases
+
+
+def write_merged_html(report_path, shards, wall_time):
+    # shards: list of dicts with index, junit, html, exit_code
+    rows, totals = [], {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+    for shard in shards:
+        for case in _read_junit(shard["junit"]):
+            totals[case["outcome"]] += 1
+            rows.append(
+                f"<tr class='{case['outcome']}'><td>{shard['index']}</td><td>{html.escape(case['name'])}</td>"
+                f"<td>{case['outcome']}</td><td>{case['time']:.2f}s</td><td>{html.escape(case['message'])}</td></tr>"
+            )
+
+    shard_links = "".join(
+        f"<li><a href='{html.escape(os.path.relpath(shard['html'], os.path.dirname(report_path)))}'>"
+        f"Shard {shard['index']}</a> (exit code {shard['exit_code']})</li>"
+        for shard in shards
+    )
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in totals.items())
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(os.path.basename(report_path))}</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 20px; }}
+table {{ border-collapse: collapse; width: 100%; }}
+td, th {{ border: 1px solid #ddd; padding: 4px 8px; text-align: left; }}
+tr.failed, tr.error {{ background: #fdd; }} tr.skipped {{ background: #ffd; }}
+</style></head><body>
+<h1>Test Report ({len(shards)} shards)</h1>
+<p>{summary} &mdash; wall time {wall_time:.1f}s</p>
+<h2>Per-shard pytest-html reports</h2><ul>{shard_links}</ul>
+<h2>Results</h2>
+<table><tr><th>Shard</th><th>Test</th><th>Outcome</th><th>Duration</th><th>Message</th></tr>
+{''.join(rows)}
+</table></body></html>
+"""
+    with open(report_path, "w", encoding="utf-8") as file:
+        file.write(page)
+    return totals